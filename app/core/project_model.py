@@ -26,6 +26,9 @@ class ProjectModel(QObject):
 
     def __init__(self):
         super().__init__()
+        # Monotonic counter bumped whenever OCR text or row membership changes.
+        # Never reset, so consumers can cache derived data keyed on it across project loads.
+        self.revision: int = 0
         self._initialize_state()
 
     def _initialize_state(self):
@@ -35,6 +38,10 @@ class ProjectModel(QObject):
         self.project_name: str = ""
         self.image_paths: list[str] = []
         self.ocr_results: list[dict] = []
+        # Cached list of non-deleted results; None means it must be rebuilt
+        self._visible_cache: list[dict] | None = None
+        # Rounded row number -> index into ocr_results; None means it must be rebuilt
+        self._row_lookup: dict[float, int] | None = None
         # --- NEW: Add inpaint data to the model's state ---
         self.inpaint_data: list[dict] = []
         self.profiles: dict = {"Original": {}}
@@ -49,6 +56,7 @@ class ProjectModel(QObject):
         """
         try:
             self._initialize_state()
+            self._mark_results_changed()
             self.mmtl_path = mmtl_path
             self.temp_dir = temp_dir
             self.project_name = os.path.splitext(os.path.basename(mmtl_path))[0]
@@ -348,22 +356,45 @@ class ProjectModel(QObject):
     def sort_and_notify(self):
         """Sorts all OCR results and emits the model_updated signal for a full refresh."""
         self._sort_ocr_results()
+        self._mark_results_changed()
         self.model_updated.emit([])
 
+    def _mark_results_changed(self, rows_changed: bool = True):
+        """Bumps the revision after OCR text or row membership changes.
+        The row index and visible list only depend on which rows exist and their order, so text-only edits
+        (rows_changed=False) keep them."""
+        self.revision += 1
+        if rows_changed:
+            self._visible_cache = None
+            self._row_lookup = None
+
+    def visible_results(self) -> list[dict]:
+        """Returns the non-deleted OCR results in model order. The list is cached; do not mutate it."""
+        if self._visible_cache is None:
+            self._visible_cache = [res for res in self.ocr_results if not res.get('is_deleted', False)]
+        return self._visible_cache
+
+    def _build_row_lookup(self) -> dict[float, int]:
+        lookup = {}
+        for index, result in enumerate(self.ocr_results):
+            try: lookup.setdefault(round(float(result.get('row_number', float('nan'))), 3), index)
+            except (ValueError, TypeError): continue
+        return lookup
+
     def _find_result_by_row_number(self, row_number_to_find):
         """Internal helper to find an OCR result and its index by its row number."""
         try:
             target_rn_float = float(row_number_to_find)
         except (ValueError, TypeError):
             return None, -1
-        for index, result in enumerate(self.ocr_results):
-            try:
-                current_rn_float = float(result.get('row_number', float('nan')))
-                if not math.isnan(current_rn_float) and math.isclose(current_rn_float, target_rn_float):
-                    return result, index
-            except (ValueError, TypeError):
-                continue
-        return None, -1
+        # Every path that adds, removes or reorders rows goes through _mark_results_changed or _sort_ocr_results,
+        # which drop the index, so a hit is current and a miss means the row doesn't exist
+        if self._row_lookup is None:
+            self._row_lookup = self._build_row_lookup()
+        index = self._row_lookup.get(round(target_rn_float, 3))
+        if index is None:
+            return None, -1
+        return self.ocr_results[index], index
 
     def _sort_ocr_results(self):
         """Sorts OCR results primarily by filename, then by row number."""
@@ -375,6 +406,8 @@ class ProjectModel(QObject):
                     row_num = float('inf')
                 return (item.get('filename', ''), row_num)
             self.ocr_results.sort(key=sort_key)
+            self._visible_cache = None
+            self._row_lookup = None
         except Exception as e:
             print(f"Error during sorting OCR results: {e}. Check row_number values.")
             traceback.print_exc(file=sys.stdout)
@@ -391,10 +424,16 @@ class ProjectModel(QObject):
         
         return original_text
         
+    def replace_results(self, new_results: list[dict]):
+        """Swaps in a whole new set of OCR results (e.g. an imported master file) and drops the cached views of the old ones."""
+        self.ocr_results = new_results
+        self._mark_results_changed()
+
     def clear_standard_results(self):
         """Removes all non-manual OCR results before a new run."""
         results_to_keep = [res for res in self.ocr_results if res.get('is_manual', False)]
         self.ocr_results = results_to_keep
+        self._mark_results_changed()
         
         max_existing_base = -1
         if results_to_keep:
@@ -412,6 +451,7 @@ class ProjectModel(QObject):
         
         self.ocr_results.extend(new_results)
         self._sort_ocr_results()
+        self._mark_results_changed()
         
         affected_filename = new_results[0].get('filename')
         self.model_updated.emit([affected_filename] if affected_filename else [])
@@ -513,6 +553,7 @@ class ProjectModel(QObject):
         else:
             target_result['translations'][self.active_profile_name] = new_text
 
+        self._mark_results_changed(rows_changed=False) # Text only; rows and their order are unchanged
         self.model_updated.emit([target_result.get('filename')])
         return None, True, profile_created, profile_created and is_user_edit
 
@@ -523,6 +564,7 @@ class ProjectModel(QObject):
             return
 
         self.ocr_results[target_index]['is_deleted'] = True
+        self._mark_results_changed()
         print(f"Marked row {row_number_to_delete} as deleted in model.")
         
         affected_filename = target_result.get('filename')
@@ -561,6 +603,7 @@ class ProjectModel(QObject):
                 self.ocr_results[delete_index]['is_deleted'] = True
                 affected_filenames.add(result_to_delete.get('filename'))
 
+        self._mark_results_changed()
         self.model_updated.emit(list(filter(None, affected_filenames)))
         return f"Combined rows into row {first_row_number} in profile '{self.active_profile_name}'", True
 
@@ -573,9 +616,7 @@ class ProjectModel(QObject):
         applied_count = 0
 
         if translation_data:
-            for result in self.ocr_results:
-                if result.get('is_deleted', False): continue
-                
+            for result in self.visible_results():
                 filename = result.get('filename')
                 row_number_str = str(result.get('row_number'))
 
@@ -588,5 +629,6 @@ class ProjectModel(QObject):
         
         print(f"Added profile '{profile_name}'. Applied {applied_count} translations.")
         self.active_profile_name = profile_name
+        self._mark_results_changed(rows_changed=False)
         self.profiles_updated.emit()
         self.model_updated.emit([])
\ No newline at end of file
@@ -63,6 +63,7 @@ class ContextFillHandler:
         if self.is_active: return
         self.scroll_area.cancel_active_modes(exclude_handler=self)
         self.is_active = True
+        self.scroll_area.set_active_handler(self)
         
         self._clear_selection_state()
         self._set_selection_enabled_on_all(True)
@@ -122,11 +123,16 @@ class ContextFillHandler:
         if not self.is_active: return
         print("Cancelling Context Fill mode...")
         self.is_active = False
+        self.scroll_area.clear_active_handler(self)
         self.overlay_widget.hide()
         self._clear_selection_state()
         self._set_selection_enabled_on_all(False)
         print("Context Fill mode cancelled.")
 
+    def cancel(self):
+        """Generic cancel hook for the scroll area; ends context fill mode."""
+        self.cancel_mode()
+
     def reset_selection(self):
         """Clears all selections to allow for a new session."""
         self._clear_selection_state()
@@ -69,6 +69,7 @@ class ManualOCRHandler(QObject):
         if checked:
             self.scroll_area.cancel_active_modes(exclude_handler=self)
             self.is_active = True
+            self.scroll_area.set_active_handler(self)
             
             if not self.scroll_area.main_window.reader:
                 print("ManualOCRHandler: Reader not found, requesting initialization...")
@@ -100,6 +101,7 @@ class ManualOCRHandler(QObject):
         if not self.is_active: return
         print("Cancelling Manual OCR mode...")
         self.is_active = False
+        self.scroll_area.clear_active_handler(self)
         # --- MODIFIED: Explicitly hide the overlay on cancel ---
         self.overlay_widget.hide()
 
@@ -114,6 +116,10 @@ class ManualOCRHandler(QObject):
         self._set_selection_enabled_on_all(False)
         print("Manual OCR mode cancelled.")
 
+    def cancel(self):
+        """Generic cancel hook for the scroll area; ends manual OCR mode."""
+        self.cancel_mode()
+
     def reset_selection(self):
         """Clears the current selection to allow for a new one."""
         self._clear_selection_state()
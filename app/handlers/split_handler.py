@@ -73,6 +73,7 @@ class SplitHandler(QObject):
         if self.is_active: return
         self.scroll_area.cancel_active_modes(exclude_handler=self)
         self.is_active = True
+        self.scroll_area.set_active_handler(self)
         self.selected_label = None
         self.split_points = []
         
@@ -163,6 +164,7 @@ class SplitHandler(QObject):
             new_label.manual_area_selected.connect(self.scroll_area.manual_ocr_handler.handle_area_selected)
             new_label.manual_area_selected.connect(self.scroll_area.context_fill_handler.handle_area_selected)
             scroll_layout.insertWidget(source_label_index + i, new_label)
+        self.scroll_area.main_window.refresh_image_labels()
 
         self.model.sort_and_notify()
         # Success message - keep QMessageBox.information for non-error cases
@@ -183,11 +185,16 @@ class SplitHandler(QObject):
             widget.enable_splitting_selection(False)
         
         self.is_active = False
+        self.scroll_area.clear_active_handler(self)
         self.selected_label = None
         self.split_points = []
         self.split_widget.hide()
         print("Exited splitting selection mode.")
     
+    def cancel(self):
+        """Generic cancel hook for the scroll area; ends splitting mode."""
+        self.cancel_splitting_mode()
+
     def clear_split_points(self):
         """Removes the split indicator and deselects the image."""
         if self.selected_label:
@@ -62,6 +62,7 @@ class StitchHandler(QObject):
         if self.is_active: return
         self.scroll_area.cancel_active_modes(exclude_handler=self)
         self.is_active = True
+        self.scroll_area.set_active_handler(self)
         self.selected_images.clear()
         self.btn_confirm.setEnabled(False)
         
@@ -182,6 +183,7 @@ class StitchHandler(QObject):
         # Connect to the scroll_area's handlers, not main_window's
         new_label.manual_area_selected.connect(self.scroll_area.manual_ocr_handler.handle_area_selected)
         scroll_layout.insertWidget(first_label_index, new_label)
+        self.scroll_area.main_window.refresh_image_labels()
 
         self.model.sort_and_notify()
         # Success message - keep QMessageBox.information for non-error cases
@@ -198,10 +200,15 @@ class StitchHandler(QObject):
             except (TypeError, RuntimeError): pass
             widget.enable_stitching_selection(False)
         self.is_active = False
+        self.scroll_area.clear_active_handler(self)
         self.selected_images.clear()
         self.stitch_widget.hide()
         print("Exited stitching selection mode.")
 
+    def cancel(self):
+        """Generic cancel hook for the scroll area; ends stitching mode."""
+        self.cancel_stitching_mode()
+
     def _update_widget_position(self):
         """Positions the control widget at the top-center of the scroll area."""
         if not self.stitch_widget.isVisible(): return
@@ -1,10 +1,13 @@
 # --- START OF FILE app/find_replace.py ---
 
-from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLineEdit, QPushButton, QLabel, QTextEdit, QCheckBox, QSizePolicy, QAbstractItemView, QFrame) # Added QFrame
+from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLineEdit, QPushButton, QLabel, QCheckBox, QSizePolicy, QAbstractItemView, QFrame) # Added QFrame
 from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QTextCursor, QTextCharFormat, QColor, QSyntaxHighlighter, QFont, QTextDocument
+from PySide6.QtGui import QTextCharFormat, QColor, QSyntaxHighlighter, QFont, QTextDocument
 import qtawesome as qta
 import re
+import time
+import weakref
+import shiboken6
 from assets import FIND_REPLACE_STYLESHEET
 
 # --- SearchHighlighter class remains the same ---
@@ -17,15 +20,41 @@ class SearchHighlighter(QSyntaxHighlighter):
         self.highlight_format.setBackground(QColor("#DAA520")) # Goldenrod / VSCode search yellow
         self.highlight_format.setForeground(QColor("black"))
         self.highlight_format.setFontWeight(QFont.Bold)
+        # Stronger format for the match the user navigated to
+        self.current_format = QTextCharFormat(self.highlight_format)
+        self.current_format.setBackground(QColor("#FF8C00")) # Dark orange
+        self._current_span: tuple[int, int] | None = None # Document positions of the current match
+        self._has_formats = False # True once any block has been painted since the last full rehighlight
 
     @property
     def pattern(self): return self._pattern
 
     def setPattern(self, pattern: str, case_sensitive: bool):
+        if not pattern: self._current_span = None
         if pattern != self._pattern or case_sensitive != self._case_sensitive:
             self._pattern = pattern; self._case_sensitive = case_sensitive
+            self._has_formats = False
             self.rehighlight()
 
+    def clear(self):
+        """Drops the pattern; only walks the document if something was actually painted."""
+        self._current_span = None
+        self._pattern = ""
+        if self._has_formats:
+            self._has_formats = False
+            self.rehighlight()
+
+    def setCurrent(self, start: int | None, end: int | None):
+        """Marks [start, end) as the current match, repainting only the blocks that change."""
+        old_span = self._current_span
+        self._current_span = (start, end) if start is not None else None
+        if old_span == self._current_span: return
+        doc = self.document()
+        for span in (old_span, self._current_span):
+            if span: self.rehighlightBlock(doc.findBlock(span[0]))
+
+    def clearCurrent(self): self.setCurrent(None, None)
+
     def highlightBlock(self, text: str):
         if not self._pattern: return
         flags = re.NOFLAG if self._case_sensitive else re.IGNORECASE
@@ -35,7 +64,14 @@ class SearchHighlighter(QSyntaxHighlighter):
             for match in re.finditer(escaped_pattern, text, flags=flags):
                 start, end = match.span()
                 self.setFormat(start, end - start, self.highlight_format)
+                self._has_formats = True
         except re.error as e: print(f"Highlighter: Regex error: {e}")
+        if self._current_span:
+            block_start = self.currentBlock().position()
+            start, end = self._current_span
+            if block_start <= start <= block_start + len(text):
+                self.setFormat(start - block_start, end - start, self.current_format)
+                self._has_formats = True
 
 
 # --- FindReplaceWidget Class ---
@@ -43,6 +79,8 @@ class FindReplaceWidget(QWidget):
     closed = Signal()
     request_update_ocr_data = Signal(object, str)
 
+    SEARCH_DEBOUNCE_MS = 300
+
     def __init__(self, main_window):
         super().__init__(main_window)
         self.main_window = main_window
@@ -50,11 +88,17 @@ class FindReplaceWidget(QWidget):
 
         self.matches = []
         self.current_match_index = -1
-        self._active_highlighters: dict[QTextDocument, SearchHighlighter] = {}
+        self._last_query = None  # (term, filters, profile, model revision) of the last completed search
+        # Weak keys so documents of destroyed row widgets drop out without waiting for a profile change
+        self._active_highlighters: weakref.WeakKeyDictionary[QTextDocument, SearchHighlighter] = weakref.WeakKeyDictionary()
+        self._current_highlighter: SearchHighlighter | None = None # Highlighter painting the current match
         self.search_timer = QTimer(self); self.search_timer.setSingleShot(True)
-        self.search_timer.setInterval(300); self.search_timer.timeout.connect(self.find_text)
+        self.search_timer.timeout.connect(self._on_search_timer)
+        self._last_text_change_ns = 0  # monotonic time of the last keystroke in find_input
         self._is_highlighting = False  # Flag to prevent textChanged from triggering updates during highlighting
-        self._highlighting_text_cache = {}  # Cache text during highlighting to detect false changes
+        # Single reusable timer that clears _is_highlighting once control returns to the event loop
+        self._clear_flag_timer = QTimer(self); self._clear_flag_timer.setSingleShot(True)
+        self._clear_flag_timer.timeout.connect(self._clear_highlighting_flag)
 
         # Filter states (add more as needed)
         self._match_case = False
@@ -65,6 +109,9 @@ class FindReplaceWidget(QWidget):
         self.hide()
         self.setStyleSheet(FIND_REPLACE_STYLESHEET)
 
+    @property
+    def is_highlighting(self): return self._is_highlighting # Editors ignore textChanged while this is set
+
     def _init_ui(self):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0) # Remove margins from main layout
@@ -198,42 +245,44 @@ class FindReplaceWidget(QWidget):
         self.find_text() # Re-run search when filters change
 
 
-    def schedule_find(self): self.search_timer.start()
+    def schedule_find(self):
+        # Only stamp the keystroke; the pending timer re-arms itself for the remaining time when it fires
+        self._last_text_change_ns = time.monotonic_ns()
+        if not self.search_timer.isActive(): self.search_timer.start(self.SEARCH_DEBOUNCE_MS)
 
-    def find_text(self):
+    def _on_search_timer(self):
+        """Runs the debounced search once no keystroke has arrived for SEARCH_DEBOUNCE_MS."""
+        elapsed_ms = (time.monotonic_ns() - self._last_text_change_ns) // 1_000_000
+        if elapsed_ms < self.SEARCH_DEBOUNCE_MS:
+            self.search_timer.start(self.SEARCH_DEBOUNCE_MS - elapsed_ms); return
+        self.find_text() # Stale fires (term unchanged since the last search) are dropped by find_text's query check
+
+    def find_text(self, force=False):
+        """Searches all visible OCR rows. Pass force=True after the result widgets were rebuilt."""
         search_term = self.find_input.text()
-        
-        # Log current profile
-        active_profile = getattr(self.main_window.model, 'active_profile_name', 'Unknown')
-        
-        # Log current match info before clearing
-        if self.current_match_index >= 0 and self.current_match_index < len(self.matches):
-            current_match = self.matches[self.current_match_index]
-        
+        model = self.main_window.model
+
+        # Skip the full rescan when nothing that affects the result set has changed
+        new_query = (search_term, self._match_case, self._match_whole_word, self._use_regex,
+                     model.active_profile_name, model.revision)
+        if not force and self.matches and self._last_query == new_query:
+            return
+        self._last_query = new_query
+
         self.clear_highlights()
         self.matches = []
         self.current_match_index = -1
 
         # Update highlighters with current pattern and case sensitivity
         case_sensitive = self._match_case # Use internal state
-        valid_highlighters = {}
-        for doc, highlighter in self._active_highlighters.items():
-            try:
-                # Check if document is still valid
-                if doc and doc.parent():
-                    highlighter.setPattern(search_term, case_sensitive)
-                    valid_highlighters[doc] = highlighter
-            except (AttributeError, RuntimeError):
-                # Document or parent widget has been deleted, skip this highlighter
-                continue
-        # Update active highlighters to only include valid ones
-        self._active_highlighters = valid_highlighters
+        for highlighter in self._live_highlighters():
+            highlighter.setPattern(search_term, case_sensitive)
 
         if not search_term:
             self.update_match_count_label(); return
 
         flags = re.NOFLAG if case_sensitive else re.IGNORECASE
-        visible_results = [res for res in self.main_window.model.ocr_results if not res.get('is_deleted', False)]
+        visible_results = model.visible_results()
 
         try:
             # --- Prepare search pattern based on filters ---
@@ -249,11 +298,16 @@ class FindReplaceWidget(QWidget):
             # to show matches in what will actually be replaced
             search_in_user_edit = False
             existing_user_edit = None
-            if self.main_window.model.active_profile_name == "Original":
-                existing_user_edit = self.main_window.model._find_existing_user_edit_profile()
+            if model.active_profile_name == "Original":
+                existing_user_edit = model._find_existing_user_edit_profile()
                 if existing_user_edit:
                     search_in_user_edit = True
-            
+
+            # Bind hot-loop lookups to locals once; this loop runs over every visible row per search
+            compiled_finditer = re.compile(pattern_to_search, flags).finditer
+            get_display_text = self.main_window.get_display_text
+            matches_append = self.matches.append
+
             for result in visible_results:
                 # Get text to search - use user edit if we're routing to it, otherwise use display text
                 if search_in_user_edit and existing_user_edit:
@@ -264,17 +318,16 @@ class FindReplaceWidget(QWidget):
                         # This row doesn't have user edit yet, search in original
                         text = result.get('text', '')
                 else:
-                    text = self.main_window.get_display_text(result)
-                
+                    text = get_display_text(result)
+
                 row_number = result.get('row_number')
                 filename = result.get('filename')
                 if row_number is None: continue
-                
 
                 # Find all matches using the constructed pattern
-                for match in re.finditer(pattern_to_search, text, flags=flags):
+                for match in compiled_finditer(text):
                     start, end = match.span()
-                    self.matches.append({
+                    matches_append({
                         'row_number': row_number, 'start': start, 'end': end,
                         'filename': filename, 'text': text
                     })
@@ -284,6 +337,7 @@ class FindReplaceWidget(QWidget):
             # Provide visual feedback for invalid regex? (e.g., input border color)
             # For now, just clear matches and show error label
             self.matches = []
+            self._last_query = None
             self.match_count_label.setText("Regex Err")
             self.update_match_count_label() # Update button states etc.
             return # Stop processing on regex error
@@ -314,6 +368,14 @@ class FindReplaceWidget(QWidget):
         replace_visible = self.replace_row_widget.isVisible() # Check container widget visibility
         self.btn_replace.setEnabled(has_matches and replace_visible); self.btn_replace_all.setEnabled(has_matches and replace_visible)
 
+    def _live_highlighters(self) -> list[SearchHighlighter]:
+        """Returns highlighters whose document is still parented to a widget, dropping stale entries."""
+        live = []
+        for doc, highlighter in list(self._active_highlighters.items()):
+            if shiboken6.isValid(doc) and doc.parent() is not None: live.append(highlighter)
+            else: self._active_highlighters.pop(doc, None)
+        return live
+
     def _get_or_create_highlighter(self, document: QTextDocument) -> SearchHighlighter:
         if document not in self._active_highlighters: self._active_highlighters[document] = SearchHighlighter(document)
         return self._active_highlighters[document]
@@ -333,31 +395,16 @@ class FindReplaceWidget(QWidget):
             return None, None, None
         
         if self.main_window.advanced_mode_check.isChecked():
-            table = results_widget.results_table
-            for r in range(table.rowCount()):
-                 item = table.item(r, 0)
-                 try:
-                      item_rn = item.data(Qt.UserRole) if item else None
-                      if item_rn is not None and float(item_rn) == float(row_number):
-                          return 'table', item, table
-                 except (ValueError, TypeError): continue
+            row = results_widget.results_model.row_for_row_number(row_number)
+            if row is not None:
+                return 'table', results_widget.results_model.index(row, 0), results_widget.results_table
         else:
-            # Check if simple_scroll_layout exists to avoid errors
-            if not hasattr(results_widget, 'simple_scroll_layout'): 
-                return None, None, None
-            layout = results_widget.simple_scroll_layout
-            for i in range(layout.count()):
-                item_layout = layout.itemAt(i)
-                container_widget = item_layout.widget() if item_layout else None
-                if container_widget:
-                    try:
-                         widget_row_number = container_widget.property("ocr_row_number")
-                         if widget_row_number is not None and float(widget_row_number) == float(row_number):
-                             text_edit_found = container_widget.findChild(QTextEdit)
-                             if text_edit_found:
-                                 return 'simple_text_edit', text_edit_found, container_widget
-                    except (ValueError, TypeError) as e:
-                        continue
+            container_widget = results_widget.simple_row_container(row_number)
+            if container_widget is not None:
+                # Rows far from the viewport are placeholders until built
+                text_edit_found = results_widget.materialize_simple_row(container_widget)
+                if text_edit_found:
+                    return 'simple_text_edit', text_edit_found, container_widget
         
         return None, None, None
 
@@ -368,16 +415,20 @@ class FindReplaceWidget(QWidget):
             return
         
         match_info = self.matches[index]
-        
+
+        # Flag stays up until the event loop has drained any textChanged queued by the selection below
+        self._is_highlighting = True
+        self._clear_flag_timer.start(0)
+
         widget_type, target_widget, container = self._find_widget_for_match(index)
         
         if widget_type == 'table':
             try:
-                table_item = target_widget; table = container
-                if table_item and table and table_item.row() >= 0:
-                    visible_row_index = table_item.row()
+                table_index = target_widget; table = container
+                if table_index.isValid() and table:
+                    visible_row_index = table_index.row()
                     table.clearSelection(); table.selectRow(visible_row_index)
-                    table.scrollToItem(table_item, QAbstractItemView.ScrollHint.EnsureVisible)
+                    table.scrollTo(table_index, QAbstractItemView.ScrollHint.EnsureVisible)
             except (AttributeError, RuntimeError) as e:
                 # Widget might have been deleted during profile change
                 return
@@ -466,29 +517,21 @@ class FindReplaceWidget(QWidget):
                 
                 
                 # Block signals during highlighting to prevent textChanged from triggering update_ocr_text
-                self._is_highlighting = True
-                # Store original text to detect if it actually changed
-                original_text = widget_text
                 target_text_edit.blockSignals(True)
                 try:
                     doc = target_text_edit.document()
                     if doc and doc.parent():
                         highlighter = self._get_or_create_highlighter(doc)
                         highlighter.setPattern(self.find_input.text(), self._match_case) # Ensure pattern set
-                        cursor = target_text_edit.textCursor()
-                        cursor.setPosition(start)
-                        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
-                        target_text_edit.setTextCursor(cursor)
+                        # Paint the current match through the highlighter instead of moving the text cursor,
+                        # which would fire the full selection-change cascade
+                        if self._current_highlighter is not highlighter: self._clear_current_match()
+                        highlighter.setCurrent(start, end)
+                        self._current_highlighter = highlighter
                 except Exception as e:
                     pass
                 finally:
                     target_text_edit.blockSignals(False)
-                    # Store the text that was there before highlighting to detect false changes
-                    if not hasattr(self, '_highlighting_text_cache'):
-                        self._highlighting_text_cache = {}
-                    self._highlighting_text_cache[id(target_text_edit)] = original_text
-                    # Use QTimer to reset flag after Qt processes any queued events (longer delay to catch queued textChanged)
-                    QTimer.singleShot(200, lambda: self._clear_highlighting_flag(id(target_text_edit)))
                 # Access the scroll area within the results_widget
                 if hasattr(self.main_window, 'results_widget') and self.main_window.results_widget:
                     if hasattr(self.main_window.results_widget, 'simple_scroll'):
@@ -499,10 +542,15 @@ class FindReplaceWidget(QWidget):
         
         self.update_match_count_label()
 
-    def _clear_highlighting_flag(self, widget_id):
-        """Clears the highlighting flag and cache for a specific widget."""
-        if widget_id in self._highlighting_text_cache:
-            del self._highlighting_text_cache[widget_id]
+    def _clear_current_match(self):
+        """Removes the current-match emphasis from whichever document last had it."""
+        highlighter, self._current_highlighter = self._current_highlighter, None
+        if highlighter is None: return
+        try: highlighter.clearCurrent()
+        except RuntimeError: pass # Document was deleted along with its widget
+
+    def _clear_highlighting_flag(self):
+        """Clears the highlighting flag once queued events from highlight_match have been processed."""
         self._is_highlighting = False
     
     def focus_current_match(self):
@@ -527,20 +575,9 @@ class FindReplaceWidget(QWidget):
             # Widget might be in the process of being deleted
             pass
         
-        # Safely clear highlighters, filtering out those with invalid documents
-        valid_highlighters = {}
-        for doc, highlighter in self._active_highlighters.items():
-            try:
-                # Check if document is still valid by trying to access it
-                if doc and doc.parent():
-                    highlighter.setPattern("", self._match_case)
-                    valid_highlighters[doc] = highlighter
-            except (AttributeError, RuntimeError):
-                # Document or parent widget has been deleted, skip this highlighter
-                continue
-        
-        # Update active highlighters to only include valid ones
-        self._active_highlighters = valid_highlighters
+        # Safely clear highlighters, skipping (and dropping) those with invalid documents
+        for highlighter in self._live_highlighters():
+            highlighter.clear()
 
     def find_next(self):
         if not self.matches:
@@ -653,7 +690,8 @@ class FindReplaceWidget(QWidget):
         flags = re.NOFLAG if case_sensitive else re.IGNORECASE
 
         replaced_count = 0; rows_updated = set()
-        visible_results_indices = [idx for idx, res in enumerate(self.main_window.model.ocr_results) if not res.get('is_deleted', False)]
+        # update_text below invalidates the model's cache; this reference keeps iterating the pre-replace rows
+        visible_results = self.main_window.model.visible_results()
 
         try:
             # --- Prepare search pattern based on filters ---
@@ -668,13 +706,17 @@ class FindReplaceWidget(QWidget):
             existing_user_edit = None
             if was_original:
                 existing_user_edit = self.main_window.model._find_existing_user_edit_profile()
-            
-            for data_index in visible_results_indices:
-                 result_to_update = self.main_window.model.ocr_results[data_index]
+
+            # Bind hot-loop lookups to locals once
+            compiled_subn = re.compile(pattern_to_search, flags).subn
+            get_display_text = self.main_window.get_display_text
+            update_text = self.main_window.model.update_text
+
+            for result_to_update in visible_results:
                  row_number = result_to_update['row_number']
-                 
+
                  # Get the text to work with - use user edit if exists, otherwise display text
-                 text_to_replace = self.main_window.get_display_text(result_to_update)
+                 text_to_replace = get_display_text(result_to_update)
                  if was_original and existing_user_edit:
                      # Check if this result has a translation in the user edit profile
                      translations = result_to_update.get('translations', {})
@@ -682,10 +724,10 @@ class FindReplaceWidget(QWidget):
                          text_to_replace = translations[existing_user_edit]
 
                  # Use re.subn which counts replacements
-                 new_text, num_subs = re.subn(pattern_to_search, replace_term, text_to_replace, flags=flags)
+                 new_text, num_subs = compiled_subn(replace_term, text_to_replace)
 
                  if num_subs > 0:
-                     result = self.main_window.model.update_text(row_number, new_text, is_user_edit=False)
+                     result = update_text(row_number, new_text, is_user_edit=False)
                      # Check if profile was created (only on first update if in Original)
                      # Format: (error, success, profile_created, should_show_message)
                      if len(result) == 4 and result[2] and was_original and not profile_created:  # profile_created is True
@@ -713,29 +755,11 @@ class FindReplaceWidget(QWidget):
         results_widget = self.main_window.results_widget
 
         if self.main_window.advanced_mode_check.isChecked():
-            table = results_widget.results_table
-            for r in range(table.rowCount()):
-                 item = table.item(r, 0)
-                 try:
-                      item_rn = item.data(Qt.UserRole) if item else None
-                      if item_rn is not None and float(item_rn) == float(row_number):
-                          table.blockSignals(True); item.setText(new_text); table.blockSignals(False); break
-                 except (ValueError, TypeError): continue
+            # The table reads straight from the project model, which already holds new_text
+            results_widget._update_table_cell_if_visible(row_number, 0, new_text)
         else:
-            # Check if simple_scroll_layout exists to avoid errors
-            if not hasattr(results_widget, 'simple_scroll_layout'): return
-            layout = results_widget.simple_scroll_layout
-            for i in range(layout.count()):
-                item_layout = layout.itemAt(i); container_widget = item_layout.widget() if item_layout else None
-                if container_widget:
-                    try:
-                         widget_row_number = container_widget.property("ocr_row_number")
-                         if widget_row_number is not None and float(widget_row_number) == float(row_number):
-                             target_text_edit = container_widget.findChild(QTextEdit)
-                             if target_text_edit:
-                                 target_text_edit.blockSignals(True); target_text_edit.setText(new_text); target_text_edit.blockSignals(False)
-                             break
-                    except (ValueError, TypeError): continue
+            # Row index lookup; placeholder rows read the model when they are built, so they are skipped
+            results_widget._update_simple_view_text_if_visible(row_number, new_text)
 
     def toggle_replace_visible(self, checked):
         self.replace_row_widget.setVisible(checked) # Show/hide the container
@@ -793,10 +817,11 @@ class FindReplaceWidget(QWidget):
         for doc, highlighter in list(self._active_highlighters.items()):
             try:
                 if highlighter:
-                    highlighter.setPattern("", self._match_case)
+                    highlighter.clear()
             except (AttributeError, RuntimeError) as e:
                 pass
         self._active_highlighters.clear()
+        self._current_highlighter = None
         
         # Clear table selection if it exists
         try:
@@ -37,6 +37,7 @@ class ResizableImageLabel(QGraphicsView):
         self.scene().setSceneRect(0, 0, self.original_pixmap.width(), self.original_pixmap.height())
         self.setInteractive(True)
         self.text_boxes = []
+        self._text_visible = True # Last value passed to set_text_visibility; new text boxes follow it
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         self.original_text_entries = {}
         self.selection_visuals = []
@@ -44,6 +45,7 @@ class ResizableImageLabel(QGraphicsView):
         self.inpaint_records = []
         self.inpaint_visuals = []
         self.inpaint_patch_items = [] 
+        self._inpaints_applied = True # Last value passed to set_inpaints_applied; new patches follow it
         self._is_inpaint_edit_mode = False
 
         self._is_manual_select_active = False
@@ -107,6 +109,8 @@ class ResizableImageLabel(QGraphicsView):
             item.setFlag(QGraphicsItem.ItemIsSelectable, enabled)
 
     def set_inpaints_applied(self, applied: bool):
+        if applied == self._inpaints_applied: return
+        self._inpaints_applied = applied
         for item in self.inpaint_patch_items:
             item.setVisible(applied)
 
@@ -137,6 +141,7 @@ class ResizableImageLabel(QGraphicsView):
         patch_item.setPos(coordinates.topLeft())
         # --- Z-Value 1: Above base image, below text boxes ---
         patch_item.setZValue(1)
+        if not self._inpaints_applied: patch_item.setVisible(False)
         self.inpaint_patch_items.append(patch_item)
 
     def revert_to_original(self):
@@ -188,6 +193,7 @@ class ResizableImageLabel(QGraphicsView):
                                          initial_style=combined_style)
 
                 text_box.setZValue(2) # On top of inpaint patches
+                if not self._text_visible: text_box.setVisible(False)
                 text_box.signals.rowDeleted.connect(self.handle_text_box_deleted)
                 text_box.signals.selectedChanged.connect(self.on_text_box_selected)
                 self.scene().addItem(text_box)
@@ -221,6 +227,8 @@ class ResizableImageLabel(QGraphicsView):
         self.selection_visuals.clear()
         
     def set_text_visibility(self, visible):
+        if visible == self._text_visible: return
+        self._text_visible = visible
         for text_box in self.text_boxes:
             text_box.setVisible(visible)
 
@@ -1,7 +1,9 @@
 # scroll_container.py
 
+from functools import cached_property
 from PySide6.QtWidgets import QScrollArea, QWidget, QHBoxLayout, QPushButton
-from PySide6.QtCore import Signal, QPoint
+from PySide6.QtCore import Qt, Signal, Slot, QPoint, QTimer, QSize, QRect
+from PySide6.QtGui import QIcon
 import qtawesome as qta
 from assets import IV_BUTTON_STYLES
 from app.handlers.stitch_handler import StitchHandler
@@ -10,7 +12,15 @@ from app.handlers.context_fill_handler import ContextFillHandler
 from app.handlers.manual_ocr_handler import ManualOCRHandler
 # --- MODIFIED: Import the generic Menu class and the new ToggleButton ---
 from app.ui.widgets.menus import Menu, ToggleButton
-from app.ui.components.image_area.label import ResizableImageLabel
+
+# White qtawesome icons rendered once per process and shared by every scroll area
+_ICON_CACHE: dict[str, QIcon] = {}
+
+def _icon(name):
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = _ICON_CACHE[name] = qta.icon(name, color='white')
+    return icon
     
 class CustomScrollArea(QScrollArea):
     """
@@ -18,6 +28,8 @@ class CustomScrollArea(QScrollArea):
     making them independent of the main window.
     """
     resized = Signal()
+    OVERLAY_W = 320 # Fixed size of the bottom button overlay
+    OVERLAY_H = 60
 
     def __init__(self, main_window, parent=None):
         """ The scroll area instantiates its own action handlers, passing only
@@ -28,186 +40,264 @@ class CustomScrollArea(QScrollArea):
         self.overlay_widget = None
         self._text_is_visible = True
         self._inpainting_is_visible = True
+        self._action_menu = None # Built on first open and reused afterwards
+        self._save_menu = None # Same for the Save menu
+        self._active_handler = None # Set by handlers when their mode starts, cleared on cancel
+        self._active_position_updater = None # Bound _update_widget_position of the active handler
+        self._last_viewport_size = QSize() # Viewport size seen by the last handled resize
+        self._overlay_rect = QRect(0, 0, self.OVERLAY_W, self.OVERLAY_H) # Reused by update_overlay_position
         
         # Instantiate all handlers, breaking the MainWindow dependency
         self.manual_ocr_handler = ManualOCRHandler(self, self.model)
         self.manual_ocr_handler.reader_initialization_requested.connect(self.main_window._initialize_ocr_reader)
-        self.stitch_handler = StitchHandler(self, self.model)
-        self.split_handler = SplitHandler(self, self.model)
         self.context_fill_handler = ContextFillHandler(self, self.model)
-        
-        self.action_handlers = [
-            self.manual_ocr_handler, self.stitch_handler, 
-            self.split_handler, self.context_fill_handler
-        ]
+        # Stitch and split handlers are only built when first used (see the cached properties below)
+
+        # Coalesces bursts of scroll ticks into at most one handler reposition per event-loop pass
+        self._pos_update_timer = QTimer(self)
+        self._pos_update_timer.setSingleShot(True)
+        self._pos_update_timer.setInterval(0)
+        self._pos_update_timer.timeout.connect(self.update_handler_ui_positions)
 
         self._init_overlay()
         self.resized.connect(self.update_handler_ui_positions)
-        self.verticalScrollBar().valueChanged.connect(self.update_handler_ui_positions)
+        self.verticalScrollBar().valueChanged.connect(self._on_vertical_scroll)
+
+    @cached_property
+    def stitch_handler(self):
+        return StitchHandler(self, self.model)
+
+    @cached_property
+    def split_handler(self):
+        return SplitHandler(self, self.model)
 
     def _init_overlay(self):
         """ Creates and configures the overlay widget and its buttons. """
-        self.overlay_widget = QWidget(self)
+        # Lives on the viewport next to the content widget; it has no background of its own to fill
+        self.overlay_widget = QWidget(self.viewport())
         self.overlay_widget.setObjectName("ScrollButtonOverlay")
-        self.overlay_widget.setStyleSheet("#ScrollButtonOverlay { background-color: transparent; }")
+        self.overlay_widget.setAttribute(Qt.WA_TranslucentBackground)
+        self.overlay_widget.setAttribute(Qt.WA_NoSystemBackground)
 
         layout = QHBoxLayout(self.overlay_widget)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(1)
 
         # Scroll to Top Button
-        btn_scroll_top = QPushButton(qta.icon('fa5s.arrow-up', color='white'), "")
+        btn_scroll_top = QPushButton(_icon('fa5s.arrow-up'), "")
         btn_scroll_top.setFixedSize(50, 50)
-        btn_scroll_top.clicked.connect(lambda: self.verticalScrollBar().setValue(0))
+        btn_scroll_top.clicked.connect(self._scroll_to_top)
         btn_scroll_top.setStyleSheet(IV_BUTTON_STYLES)
         layout.addWidget(btn_scroll_top)
 
         # Action Menu Button
-        btn_action_menu = QPushButton(qta.icon('fa5s.bars', color='white'), "")
+        btn_action_menu = QPushButton(_icon('fa5s.bars'), "")
         btn_action_menu.setFixedSize(50, 50)
         btn_action_menu.clicked.connect(self._show_action_menu)
         btn_action_menu.setStyleSheet(IV_BUTTON_STYLES)
         layout.addWidget(btn_action_menu)
 
         # Save Menu Button
-        btn_save_menu = QPushButton(qta.icon('fa5s.save', color='white'), "Save")
+        btn_save_menu = QPushButton(_icon('fa5s.save'), "Save")
         btn_save_menu.setFixedSize(120, 50)
         btn_save_menu.clicked.connect(self._show_save_menu)
         btn_save_menu.setStyleSheet(IV_BUTTON_STYLES)
         layout.addWidget(btn_save_menu)
 
         # Scroll to Bottom Button
-        btn_scroll_bottom = QPushButton(qta.icon('fa5s.arrow-down', color='white'), "")
+        btn_scroll_bottom = QPushButton(_icon('fa5s.arrow-down'), "")
         btn_scroll_bottom.setFixedSize(50, 50)
-        btn_scroll_bottom.clicked.connect(lambda: self.verticalScrollBar().setValue(self.verticalScrollBar().maximum()))
+        btn_scroll_bottom.clicked.connect(self._scroll_to_bottom)
         btn_scroll_bottom.setStyleSheet(IV_BUTTON_STYLES)
         layout.addWidget(btn_scroll_bottom)
 
-    def _show_action_menu(self):
-        """ Creates, populates, and shows the Action Menu using the generic Menu class. """
-        trigger_button = self.sender()
-        if not isinstance(trigger_button, QWidget):
-            return
+        self.overlay_widget.raise_()
 
+    def setWidget(self, widget):
+        """ The content widget is also a viewport child, so the overlay is raised back above it. """
+        super().setWidget(widget)
+        if self.overlay_widget:
+            self.overlay_widget.raise_()
+
+    @Slot()
+    def _scroll_to_top(self):
+        self.verticalScrollBar().setValue(0)
+
+    @Slot()
+    def _scroll_to_bottom(self):
+        scroll_bar = self.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
+    def _build_action_menu(self):
+        """ Builds the Action Menu once; the toggle buttons are kept so their state can be synced on each open. """
         menu = Menu(self)
+        menu.setAttribute(Qt.WA_DeleteOnClose, False) # Hidden on close so it can be shown again
 
         # Create and add action buttons to the menu
-        btn_hide_text = ToggleButton(
+        self._btn_hide_text = ToggleButton(
             off_text=" Show Text", on_text=" Hide Text",
-            off_icon=qta.icon('fa5s.eye', color='white'),
-            on_icon=qta.icon('fa5s.eye-slash', color='white')
+            off_icon=_icon('fa5s.eye'),
+            on_icon=_icon('fa5s.eye-slash')
         )
+        self._btn_hide_text.clicked.connect(self.toggle_text_visibility)
+        menu.addButton(self._btn_hide_text, close_on_click=False)
         
-        # If edit mode is active, text is forced off. Reflect this in the button state and disable it.
-        is_edit_mode = self.context_fill_handler.is_edit_mode_active
-        is_text_currently_visible = self._text_is_visible and not is_edit_mode
-        btn_hide_text.setState(is_text_currently_visible)
-        btn_hide_text.setEnabled(not is_edit_mode)
-        
-        btn_hide_text.clicked.connect(self.toggle_text_visibility)
-        menu.addButton(btn_hide_text, close_on_click=False)
-        
-        btn_hide_inpainting = ToggleButton(
+        self._btn_hide_inpainting = ToggleButton(
             off_text=" Show Context Fills", on_text=" Hide Context Fills",
-            off_icon=qta.icon('fa5s.eye', color='white'),
-            on_icon=qta.icon('fa5s.eraser', color='white')
+            off_icon=_icon('fa5s.eye'),
+            on_icon=_icon('fa5s.eraser')
         )
-        btn_hide_inpainting.setState(self._inpainting_is_visible)
-        btn_hide_inpainting.clicked.connect(self.toggle_inpainting_visibility)
-        menu.addButton(btn_hide_inpainting, close_on_click=False)
+        self._btn_hide_inpainting.clicked.connect(self.toggle_inpainting_visibility)
+        menu.addButton(self._btn_hide_inpainting, close_on_click=False)
 
-        btn_context_fill = QPushButton(qta.icon('fa5s.fill-drip', color='white'), " Context Fill")
+        btn_context_fill = QPushButton(_icon('fa5s.fill-drip'), " Context Fill")
         btn_context_fill.clicked.connect(self.context_fill_handler.start_mode)
         menu.addButton(btn_context_fill)
 
         # --- NEW: Edit Context Fill uses the ToggleButton to show state ---
-        btn_edit_context_fill = ToggleButton(
+        self._btn_edit_context_fill = ToggleButton(
             off_text=" Edit Context Fill", on_text=" Finish Editing",
-            off_icon=qta.icon('fa5s.paint-brush', color='white'),
-            on_icon=qta.icon('fa5s.check-circle', color='white')
+            off_icon=_icon('fa5s.paint-brush'),
+            on_icon=_icon('fa5s.check-circle')
         )
-        btn_edit_context_fill.setState(self.context_fill_handler.is_edit_mode_active)
-        btn_edit_context_fill.clicked.connect(self.context_fill_handler.toggle_edit_mode)
-        menu.addButton(btn_edit_context_fill, close_on_click=False)
+        self._btn_edit_context_fill.clicked.connect(self.context_fill_handler.toggle_edit_mode)
+        menu.addButton(self._btn_edit_context_fill, close_on_click=False)
 
-        btn_split_images = QPushButton(qta.icon('fa5s.object-ungroup', color='white'), " Split Images")
-        btn_split_images.clicked.connect(self.split_handler.start_splitting_mode)
+        btn_split_images = QPushButton(_icon('fa5s.object-ungroup'), " Split Images")
+        btn_split_images.clicked.connect(self._start_split)
         menu.addButton(btn_split_images)
         
-        btn_stitch_images = QPushButton(qta.icon('fa5s.object-group', color='white'), " Stitch Images")
-        btn_stitch_images.clicked.connect(self.stitch_handler.start_stitching_mode)
+        btn_stitch_images = QPushButton(_icon('fa5s.object-group'), " Stitch Images")
+        btn_stitch_images.clicked.connect(self._start_stitch)
         menu.addButton(btn_stitch_images)
+        return menu
 
-        # Position the menu above the button that triggered it
-        menu.set_position_and_show(trigger_button, 'top left')
-    
-    def _show_save_menu(self):
-        """Creates, populates, and shows the Save menu."""
-        trigger_button = self.sender()
+    # Read the cached handler properties only on click, so building the menu doesn't create the handlers
+    @Slot()
+    def _start_split(self):
+        self.split_handler.start_splitting_mode()
+
+    @Slot()
+    def _start_stitch(self):
+        self.stitch_handler.start_stitching_mode()
+
+    def _sync_action_menu(self):
+        """ Reflects the current visibility and edit-mode state in the Action Menu's toggle buttons. """
+        # If edit mode is active, text is forced off. Reflect this in the button state and disable it.
+        is_edit_mode = self.context_fill_handler.is_edit_mode_active
+        self._btn_hide_text.setState(self._text_is_visible and not is_edit_mode)
+        self._btn_hide_text.setEnabled(not is_edit_mode)
+        self._btn_hide_inpainting.setState(self._inpainting_is_visible)
+        self._btn_edit_context_fill.setState(is_edit_mode)
+
+    def _show_menu(self, trigger_button, menu_attr, build, corner, sync=None):
+        """ Shows the menu cached in `menu_attr` (building it on first use) relative to the trigger button. """
         if not isinstance(trigger_button, QWidget):
             return
+        menu = getattr(self, menu_attr)
+        if menu is None:
+            menu = build()
+            setattr(self, menu_attr, menu)
+        if sync is not None:
+            sync()
+        menu.set_position_and_show(trigger_button, corner)
+
+    # The show slots stay as thin @Slot() wrappers so that sender() still refers to the clicked button
+    @Slot()
+    def _show_action_menu(self):
+        self._show_menu(self.sender(), '_action_menu', self._build_action_menu, 'top left', self._sync_action_menu)
+
+    @Slot()
+    def _show_save_menu(self):
+        self._show_menu(self.sender(), '_save_menu', self._build_save_menu, 'top right')
 
+    def _build_save_menu(self):
+        """ Builds the Save menu once; it is hidden rather than deleted on close. """
         menu = Menu(self)
+        menu.setAttribute(Qt.WA_DeleteOnClose, False)
         
-        btn_save_project = QPushButton(qta.icon('fa5s.save', color='white'), " Save Project (.mmtl)")
+        btn_save_project = QPushButton(_icon('fa5s.save'), " Save Project (.mmtl)")
         btn_save_project.clicked.connect(self.main_window.save_project)
         menu.addButton(btn_save_project)
 
-        btn_save_images = QPushButton(qta.icon('fa5s.images', color='white'), " Save Rendered Images")
+        btn_save_images = QPushButton(_icon('fa5s.images'), " Save Rendered Images")
         btn_save_images.clicked.connect(self.main_window.export_manhwa)
         menu.addButton(btn_save_images)
-
-        menu.set_position_and_show(trigger_button, 'top right')
+        return menu
 
     def cancel_active_modes(self, exclude_handler=None):
         """Deactivates any currently running action handler mode."""
         if self.context_fill_handler.is_edit_mode_active and self.context_fill_handler is not exclude_handler:
             self.context_fill_handler._disable_edit_mode()
-        for handler in self.action_handlers:
-            if handler is not exclude_handler and handler.is_active:
-                if hasattr(handler, 'cancel_mode'):
-                    handler.cancel_mode()
-                elif hasattr(handler, 'cancel_stitching_mode'):
-                    handler.cancel_stitching_mode()
-                elif hasattr(handler, 'cancel_splitting_mode'):
-                    handler.cancel_splitting_mode()
+        # Starting a mode cancels the others first, so at most one handler is ever active
+        handler = self._active_handler
+        if handler is not None and handler is not exclude_handler:
+            handler.cancel()
 
+    @Slot()
     def toggle_text_visibility(self):
         """ Toggles the visibility of all text boxes in all image labels. """
         self._text_is_visible = not self._text_is_visible
-        for i in range(self.main_window.scroll_layout.count()):
-            widget = self.main_window.scroll_layout.itemAt(i).widget()
-            if isinstance(widget, ResizableImageLabel):
-                widget.set_text_visibility(self._text_is_visible)
+        self._update_labels_batched(lambda label: label.set_text_visibility(self._text_is_visible))
 
+    @Slot()
     def toggle_inpainting_visibility(self):
         """ Toggles whether the inpainting patches are applied to the images. """
         self._inpainting_is_visible = not self._inpainting_is_visible
-        for i in range(self.main_window.scroll_layout.count()):
-            widget = self.main_window.scroll_layout.itemAt(i).widget()
-            if isinstance(widget, ResizableImageLabel):
-                widget.set_inpaints_applied(self._inpainting_is_visible)
+        self._update_labels_batched(lambda label: label.set_inpaints_applied(self._inpainting_is_visible))
+
+    def _update_labels_batched(self, apply):
+        """ Applies `apply` to every image label with viewport updates suspended, then repaints once. """
+        viewport = self.viewport()
+        viewport.setUpdatesEnabled(False)
+        try:
+            for label in self.main_window.image_labels:
+                apply(label)
+        finally:
+            viewport.setUpdatesEnabled(True)
+            viewport.update()
+
+    @Slot(int)
+    def _on_vertical_scroll(self, _value):
+        """ Keeps handler overlays in place while the content scrolls. """
+        if not self._pos_update_timer.isActive():
+            self._pos_update_timer.start()
+
+    def set_active_handler(self, handler):
+        """ Called by a handler when its mode starts. """
+        self._active_handler = handler
+        self._active_position_updater = getattr(handler, '_update_widget_position', None)
+
+    def clear_active_handler(self, handler):
+        """ Called by a handler when its mode ends; ignored if another handler has since taken over. """
+        if self._active_handler is handler:
+            self._active_handler = None
+            self._active_position_updater = None
 
+    @Slot()
     def update_handler_ui_positions(self):
-        """ Updates the position of any active handler UI overlays. """
-        for handler in self.action_handlers:
-            if handler.is_active and hasattr(handler, '_update_widget_position'):
-                handler._update_widget_position()
+        """ Updates the position of the active handler's UI overlay, if any. """
+        updater = self._active_position_updater
+        if updater is not None:
+            updater()
 
     def resizeEvent(self, event):
-        """ Repositions the overlay on resize. """
+        """ Repositions the overlay on resize; no-op resizes that leave the viewport size unchanged are ignored. """
         super().resizeEvent(event)
+        viewport_size = self.viewport().size()
+        if viewport_size == self._last_viewport_size: return
+        self._last_viewport_size = viewport_size
         self.update_overlay_position()
         self.resized.emit()
 
+    @Slot()
     def update_overlay_position(self):
         """ Calculates and sets the correct position for the overlay widget. """
         if self.overlay_widget:
-            overlay_width = 320
-            overlay_height = 60
-            viewport_width = self.viewport().width()
-            viewport_height = self.viewport().height()
-            x = (viewport_width - overlay_width) // 2
-            y = viewport_height - overlay_height - 10 
-            self.overlay_widget.setGeometry(x, y, overlay_width, overlay_height)
-            self.overlay_widget.raise_()
\ No newline at end of file
+            viewport = self.viewport()
+            x = (viewport.width() - self.OVERLAY_W) >> 1
+            y = viewport.height() - self.OVERLAY_H - 10
+            rect = self._overlay_rect
+            rect.moveTo(x, y)
+            if self.overlay_widget.geometry() != rect:
+                self.overlay_widget.setGeometry(rect)
\ No newline at end of file
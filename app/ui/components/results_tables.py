@@ -1,14 +1,38 @@
 # results_widget.py
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFrame, QScrollArea, QStackedWidget,
-                             QPushButton, QTableWidget, QTableWidgetItem, QMessageBox, QHeaderView,
+                             QPushButton, QTableView, QMessageBox, QHeaderView,
                              QTextEdit, QAbstractItemView, QStyledItemDelegate)
 from app.ui.dialogs.error_dialog import ErrorDialog
-from PySide6.QtCore import Qt, Signal, QEvent
+from PySide6.QtCore import Qt, Signal, Slot, QEvent, QAbstractTableModel, QModelIndex, QRect, QTimer
 import qtawesome as qta
 import math
 from assets import SIMPLE_VIEW_STYLES, DELETE_ROW_STYLES
 
+def _normalize_newlines(text):
+    """Maps CRLF and lone CR to LF; most text has no CR, so that case skips the copies."""
+    return text.replace('\r\n', '\n').replace('\r', '\n') if '\r' in text else text
+
+def _row_key(row_number):
+    """Normalizes a row number for dict lookups (3 == 3.0, float noise rounded away); None if it is not numeric."""
+    if not isinstance(row_number, (int, float)):
+        try: row_number = float(row_number)
+        except (ValueError, TypeError): return None
+    return round(float(row_number), 3)
+
+def _format_row_number(row_number):
+    """'12' for whole row numbers, '12.5' for manually inserted ones; the model stores ints/floats, so parsing is a fallback."""
+    if isinstance(row_number, int): return str(row_number)
+    if not isinstance(row_number, float):
+        try: row_number = float(row_number)
+        except (ValueError, TypeError): return str(row_number)
+    return f"{int(row_number)}" if row_number.is_integer() else f"{row_number:.1f}"
+
+def _lookup_row(row_index, row_number):
+    """row_index.get() by _row_key; a miss means the row is not in the view, so it returns None."""
+    key = _row_key(row_number)
+    return row_index.get(key) if key is not None else None
+
 class ResultsWidget(QWidget):
     # --- DELETED: rowSelected signal is no longer needed ---
     # rowSelected = Signal(object)
@@ -22,6 +46,26 @@ class ResultsWidget(QWidget):
         self.find_action = find_action
         self.focused_column = 0
         self._is_updating_views = False  # Flag to prevent textChanged from processing during view updates
+        self._display_cache = {} # (row_number, active_profile_name) -> display text
+        self._display_cache_revision = None # model.revision the cache was filled at
+        self._trash_icon = qta.icon('fa5s.trash-alt', color='red') # Shared by every simple-view delete button
+        # Bursts of external selections (e.g. dragging across boxes) are applied once per frame
+        self._pending_selection = None
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(16)
+        self._selection_timer.timeout.connect(self._apply_external_selection)
+        # Simple-view keystrokes are pushed to the model at most once per 50 ms
+        self._pending_text_edits = {} # row_number -> latest widget text
+        self._text_commit_timer = QTimer(self)
+        self._text_commit_timer.setSingleShot(True)
+        self._text_commit_timer.setInterval(50)
+        self._text_commit_timer.timeout.connect(self.flush_pending_text_edits)
+        # Rebuilds in quick succession (e.g. flicking through profiles) re-run an open search only once
+        self._find_refresh_timer = QTimer(self)
+        self._find_refresh_timer.setSingleShot(True)
+        self._find_refresh_timer.setInterval(300)
+        self._find_refresh_timer.timeout.connect(self._refresh_find_results)
         # Connect to the selection manager's signal
         self.selection_manager.selection_changed.connect(self.on_external_selection_changed)
         self._init_ui()
@@ -32,20 +76,25 @@ class ResultsWidget(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(10)
         self.right_content_stack = QStackedWidget()
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(6)
-        self.results_table.setHorizontalHeaderLabels(["Text", "Confidence", "Coordinates", "File", "Row Number", ""])
-        self.results_table.currentCellChanged.connect(self.on_table_item_selected)
+        # The table only asks the model for the cells it paints, so rebuilds no longer allocate per-row items/widgets
+        self.results_model = OcrResultsModel(self.main_window, self.display_text, self)
+        self.results_model.textEdited.connect(self.on_cell_changed)
+        self._syncing_table_selection = False # Set while an external selection moves the current index
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        self.results_table.selectionModel().currentChanged.connect(self.on_table_item_selected)
         self.results_table.setWordWrap(False)
         self.results_table.verticalHeader().setDefaultSectionSize(40)
         self.results_table.setColumnWidth(5, 50)
         self.results_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.Fixed)
         self.results_table.setContextMenuPolicy(Qt.ActionsContextMenu)
         self.results_table.setItemDelegateForColumn(0, TextEditDelegate(self))
+        self.delete_delegate = DeleteButtonDelegate(self)
+        self.delete_delegate.deleteRequested.connect(self.main_window.delete_row)
+        self.results_table.setItemDelegateForColumn(5, self.delete_delegate)
         self.results_table.addAction(self.combine_action)
         self.results_table.addAction(self.find_action)
-        self.results_table.cellChanged.connect(self.on_cell_changed)
-        self.results_table.currentCellChanged.connect(self.on_table_focus_changed)
+        self.results_table.selectionModel().currentChanged.connect(self.on_table_focus_changed)
         self.update_column_resize_modes()
         self.simple_view_widget = QWidget()
         self.simple_layout = QVBoxLayout(self.simple_view_widget)
@@ -57,6 +106,16 @@ class ResultsWidget(QWidget):
         self.simple_scroll_layout = QVBoxLayout(self.simple_scroll_content)
         self.simple_scroll.setWidget(self.simple_scroll_content)
         self.simple_scroll.setStyleSheet("border: none;")
+        # Simple-view rows start as empty placeholders; their editors are built once they come near the viewport
+        self._simple_containers = []      # Row containers in layout order
+        self._unbuilt_simple_rows = {}    # placeholder container -> result dict
+        self._simple_row_index = {}       # _row_key(row_number) -> index into _simple_containers
+        self._simple_row_min_height = None  # Measured from the first built row, reused for placeholders
+        self._simple_build_timer = QTimer(self)
+        self._simple_build_timer.setSingleShot(True)
+        self._simple_build_timer.timeout.connect(self._build_visible_simple_rows)
+        self.simple_scroll.verticalScrollBar().valueChanged.connect(self._schedule_simple_row_build)
+        self.simple_scroll.verticalScrollBar().rangeChanged.connect(self._schedule_simple_row_build)
         self.right_content_stack.addWidget(self.simple_scroll)
         self.right_content_stack.addWidget(self.results_table)
         main_layout.addWidget(self.right_content_stack, 1)
@@ -71,19 +130,26 @@ class ResultsWidget(QWidget):
             return False
         return super().eventFilter(source, event)
 
-    def on_table_item_selected(self, currentRow, currentColumn, previousRow, previousColumn):
+    def on_table_item_selected(self, current, previous):
         # --- MODIFIED: Report selection to the manager ---
-        item = self.results_table.item(currentRow, 0)
-        if item:
-            row_number = item.data(Qt.UserRole)
-            if row_number is not None:
-                self.selection_manager.select(row_number, self)
+        if self._syncing_table_selection or not current.isValid():
+            return
+        row_number = self.results_model.row_number_at(current.row())
+        if row_number is not None:
+            self.selection_manager.select(row_number, self)
 
     # --- NEW: Slot to handle selections from other widgets ---
     def on_external_selection_changed(self, row_number, source):
         # Ignore signals that this widget sent itself
         if source is self:
             return
+        self._pending_selection = row_number
+        if not self._selection_timer.isActive():
+            self._selection_timer.start()
+
+    def _apply_external_selection(self):
+        """Applies the latest external selection queued by on_external_selection_changed."""
+        row_number = self._pending_selection
         
         # If the selection was cleared externally, we don't need to do anything.
         if row_number is None:
@@ -95,13 +161,30 @@ class ResultsWidget(QWidget):
         
         # Additionally, provide visual feedback in the table
         if self.main_window.advanced_mode_check.isChecked():
-            for row in range(self.results_table.rowCount()):
-                item = self.results_table.item(row, 0)
-                if item and item.data(Qt.UserRole) == row_number:
-                    self.results_table.blockSignals(True)
-                    self.results_table.setCurrentCell(row, self.results_table.currentColumn() if self.results_table.currentColumn() != -1 else 0)
-                    self.results_table.blockSignals(False)
-                    break
+            row = self.results_model.row_for_row_number(row_number)
+            if row is not None:
+                current_column = self.results_table.currentIndex().column()
+                self._syncing_table_selection = True
+                try: self.results_table.setCurrentIndex(self.results_model.index(row, current_column if current_column != -1 else 0))
+                finally: self._syncing_table_selection = False
+
+    def display_text(self, result):
+        """Cached get_display_text; any model change bumps model.revision, which drops the cache."""
+        model = self.main_window.model
+        if self._display_cache_revision != model.revision:
+            self._display_cache.clear()
+            self._display_cache_revision = model.revision
+        key = (result.get('row_number'), model.active_profile_name)
+        text = self._display_cache.get(key)
+        if text is None:
+            text = self._display_cache[key] = self.main_window.get_display_text(result)
+        return text
+
+    def _cached_display_text(self, row_number):
+        """display_text() for row_number if it is cached for the current revision, else None. Never scans the model."""
+        if self._display_cache_revision != self.main_window.model.revision:
+            return None
+        return self._display_cache.get((row_number, self.main_window.model.active_profile_name))
 
     def update_views(self):
         """Public method called by MainWindow to refresh the currently visible view."""
@@ -115,160 +198,174 @@ class ResultsWidget(QWidget):
         # Clear the layout - this will delete old widgets
         # Highlighters should have been cleared by on_profile_changed() before this is called
         
+        # Commit any typing still waiting on the debounce before the editors go away
+        self.flush_pending_text_edits()
         # Set flag to prevent textChanged from processing during widget recreation
         self._is_updating_views = True
         
-        # Disconnect textChanged from all existing widgets before clearing to prevent them from firing
-        for i in range(self.simple_scroll_layout.count()):
-            item = self.simple_scroll_layout.itemAt(i)
-            if item:
-                widget = item.widget()
-                if widget:
-                    text_edit = widget.findChild(QTextEdit)
-                    if text_edit:
-                        try:
-                            text_edit.textChanged.disconnect()
-                        except:
-                            pass  # Ignore if not connected
+        # Silence the built editors before clearing so they can't fire textChanged while being torn down
+        for container in self._simple_containers:
+            if container not in self._unbuilt_simple_rows:
+                text_edit = container.findChild(QTextEdit)
+                if text_edit: text_edit.blockSignals(True)
         
         self.main_window._clear_layout(self.simple_scroll_layout)
+        self._simple_containers = []
+        self._unbuilt_simple_rows = {}
+        self._simple_row_index = {}
         
-        visible_results = [res for res in self.main_window.model.ocr_results if not res.get('is_deleted', False)]
-        
-        for idx, result in enumerate(visible_results):
+        for result in self.main_window.model.visible_results():
             original_row_number = result['row_number']
-            # Get display text from the current active profile - this ensures new profile text is used
-            display_text = self.main_window.get_display_text(result)
-            
+            self._simple_row_index[_row_key(original_row_number)] = len(self._simple_containers)
             container = QWidget()
             container.setProperty("ocr_row_number", original_row_number)
             container.setObjectName(f"SimpleViewRowContainer_{original_row_number}")
-            container_layout = QHBoxLayout(container)
-            container_layout.setContentsMargins(5, 5, 5, 5); container_layout.setSpacing(10)
-            text_frame = QFrame(); text_frame.setStyleSheet(SIMPLE_VIEW_STYLES)
-            text_layout = QVBoxLayout(text_frame); text_layout.setContentsMargins(0, 0, 0, 0)
-            
-            text_edit = QTextEdit()
-            text_edit.setStyleSheet(SIMPLE_VIEW_STYLES)
-            text_edit.setProperty("ocr_row_number", original_row_number)
-            text_edit.installEventFilter(self)
-            text_edit.setLineWrapMode(QTextEdit.WidgetWidth)
-            # Set text with signals blocked to prevent any interference during initialization
-            text_edit.blockSignals(True)
-            text_edit.setPlainText(display_text)
-            text_edit.blockSignals(False)
-            
-            # Connect textChanged AFTER setting text to avoid triggering during initialization
-            text_edit.textChanged.connect(lambda rn=original_row_number, te=text_edit: self.on_simple_text_changed(rn, te.toPlainText()))
-            text_layout.addWidget(text_edit)
-            delete_btn = QPushButton(qta.icon('fa5s.trash-alt', color='red'), "")
-            delete_btn.setFixedSize(40, 40); delete_btn.setStyleSheet(DELETE_ROW_STYLES)
-            delete_btn.clicked.connect(lambda _, rn=original_row_number: self.main_window.delete_row(rn))
-            container_layout.addWidget(text_frame, 1); container_layout.addWidget(delete_btn)
+            self._unbuilt_simple_rows[container] = result
+            self._simple_containers.append(container)
             self.simple_scroll_layout.addWidget(container)
         self.simple_scroll_layout.addStretch()
+
+        if self._simple_containers:
+            if self._simple_row_min_height is None:
+                self.materialize_simple_row(self._simple_containers[0])
+                self._simple_row_min_height = self._simple_containers[0].minimumSizeHint().height()
+            for container in self._unbuilt_simple_rows:
+                container.setMinimumHeight(self._simple_row_min_height)
+        self._schedule_simple_row_build()
         
         # Reset flag after widgets are created and connected
         # Use QTimer to ensure all textChanged signals from widget creation have been processed
-        from PySide6.QtCore import QTimer
         QTimer.singleShot(100, lambda: setattr(self, '_is_updating_views', False))
         
         # Refresh find widget after widgets are created with new profile text
         # Use a longer delay to ensure widgets are fully created and rendered before searching/highlighting
         if self.main_window.find_replace_widget.isVisible(): 
-            QTimer.singleShot(300, lambda: self.main_window.find_replace_widget.find_text())
+            self._find_refresh_timer.start()
+
+    def _refresh_find_results(self):
+        if self.main_window.find_replace_widget.isVisible():
+            self.main_window.find_replace_widget.find_text(force=True)
+
+    def materialize_simple_row(self, container):
+        """Builds the editor and delete button inside a placeholder row. Returns the row's QTextEdit."""
+        result = self._unbuilt_simple_rows.pop(container, None)
+        if result is None:
+            return container.findChild(QTextEdit)
+        original_row_number = result['row_number']
+        # Get display text from the current active profile - this ensures new profile text is used
+        display_text = self.display_text(result)
+        container.setMinimumHeight(0)
+        
+        container_layout = QHBoxLayout(container)
+        container_layout.setContentsMargins(5, 5, 5, 5); container_layout.setSpacing(10)
+        text_frame = QFrame(); text_frame.setStyleSheet(SIMPLE_VIEW_STYLES)
+        text_layout = QVBoxLayout(text_frame); text_layout.setContentsMargins(0, 0, 0, 0)
+        
+        text_edit = QTextEdit() # Styled by text_frame's sheet, which cascades to it
+        text_edit.setProperty("ocr_row_number", original_row_number)
+        text_edit.installEventFilter(self)
+        text_edit.setLineWrapMode(QTextEdit.WidgetWidth)
+        # Set text with signals blocked to prevent any interference during initialization
+        # No undo entry for the initial text, and a fresh editor is already empty
+        if display_text:
+            text_edit.blockSignals(True); text_edit.setUndoRedoEnabled(False)
+            text_edit.setPlainText(display_text)
+            text_edit.setUndoRedoEnabled(True); text_edit.blockSignals(False)
+        
+        # Connect textChanged AFTER setting text to avoid triggering during initialization
+        text_edit.textChanged.connect(self._on_simple_text_edit_changed)
+        text_layout.addWidget(text_edit)
+        delete_btn = QPushButton(self._trash_icon, "")
+        delete_btn.setFixedSize(40, 40); delete_btn.setStyleSheet(DELETE_ROW_STYLES)
+        delete_btn.clicked.connect(lambda _, rn=original_row_number: self.main_window.delete_row(rn))
+        container_layout.addWidget(text_frame, 1); container_layout.addWidget(delete_btn)
+        return text_edit
+
+    def simple_row_container(self, row_number):
+        """Returns the simple-view container for row_number (possibly still a placeholder), or None."""
+        idx = _lookup_row(self._simple_row_index, row_number)
+        return self._simple_containers[idx] if idx is not None else None
+
+    def _schedule_simple_row_build(self, *_):
+        if not self._simple_build_timer.isActive():
+            self._simple_build_timer.start(0)
+
+    def _build_visible_simple_rows(self):
+        """Materializes placeholder rows within one viewport height of the visible area."""
+        if not self._unbuilt_simple_rows:
+            return
+        # Rows share one height, so the visible index range follows from the scroll offset alone
+        # (widget geometry may not be laid out yet right after a rebuild)
+        row_pitch = self._simple_row_min_height + self.simple_scroll_layout.spacing()
+        top_margin = self.simple_scroll_layout.contentsMargins().top()
+        viewport_height = self.simple_scroll.viewport().height()
+        top = self.simple_scroll.verticalScrollBar().value() - viewport_height - top_margin
+        first = max(0, top // row_pitch)
+        last = (top + 3 * viewport_height) // row_pitch + 1
+        for container in self._simple_containers[first:last]:
+            if container in self._unbuilt_simple_rows:
+                self.materialize_simple_row(container)
+
+    @Slot()
+    def _on_simple_text_edit_changed(self):
+        """Shared textChanged slot for every simple-view editor; the row comes from the sender's property."""
+        text_edit = self.sender()
+        self.on_simple_text_changed(text_edit.property("ocr_row_number"), text_edit.toPlainText())
 
     def on_simple_text_changed(self, original_row_number, text):
         # Ignore textChanged during view updates (profile changes, widget recreation)
         if self._is_updating_views:
             return
-        
+        # Ignore textChanged caused by find/replace moving the selection onto a match
+        if self.main_window.find_replace_widget.is_highlighting:
+            return
+        # Cursor moves and re-highlighting also fire textChanged; when the text still matches what the
+        # model showed, drop any queued edit without touching the model
+        if text == self._cached_display_text(original_row_number):
+            self._pending_text_edits.pop(original_row_number, None)
+            return
+        self._pending_text_edits[original_row_number] = text
+        if not self._text_commit_timer.isActive():
+            self._text_commit_timer.start()
+
+    def flush_pending_text_edits(self):
+        """Pushes queued simple-view edits to the model."""
+        self._text_commit_timer.stop()
+        pending, self._pending_text_edits = self._pending_text_edits, {}
+        for original_row_number, text in pending.items():
+            self._commit_simple_text(original_row_number, text)
+
+    def _commit_simple_text(self, original_row_number, text):
         # Always check if text actually changed by comparing with model
         # This prevents false positives from cursor changes, highlighting, etc.
         result_data = self.main_window.model._find_result_by_row_number(original_row_number)[0]
         if result_data:
-            current_text_in_model = self.main_window.get_display_text(result_data)
+            current_text_in_model = self.display_text(result_data)
             # Normalize only line endings for comparison (don't strip whitespace - preserve user edits like trailing spaces)
             # This handles cases where cursor positioning adds invisible newline differences
             # but preserves meaningful whitespace changes like trailing spaces
-            normalized_widget_text = text.replace('\r\n', '\n').replace('\r', '\n')
-            normalized_model_text = current_text_in_model.replace('\r\n', '\n').replace('\r', '\n')
-            
-            if normalized_widget_text == normalized_model_text:
+            if _normalize_newlines(text) == _normalize_newlines(current_text_in_model):
                 return
             
         self.main_window.update_ocr_text(original_row_number, text)
         self._update_table_cell_if_visible(original_row_number, 0, text)
 
     def update_results_table(self):
-        self.results_table.blockSignals(True)
-        visible_results = [res for res in self.main_window.model.ocr_results if not res.get('is_deleted', False)]
-        self.results_table.setRowCount(len(visible_results))
-        active_profile = self.main_window.model.active_profile_name
-        header_text = f"Text ({active_profile})" if active_profile != "Original" else "Text (Original OCR)"
-        self.results_table.setHorizontalHeaderLabels([header_text, "Confidence", "Coordinates", "File", "Row Number", ""])
-        for visible_row_index, result in enumerate(visible_results):
-            original_row_number = result['row_number']
-            try:
-                 rn_float = float(original_row_number)
-                 display_row_number = f"{int(rn_float)}" if rn_float.is_integer() else f"{rn_float:.1f}"
-            except (ValueError, TypeError): display_row_number = str(original_row_number)
-            display_text = self.main_window.get_display_text(result)
-            text_item = QTableWidgetItem(display_text)
-            text_item.setTextAlignment(Qt.AlignTop | Qt.AlignLeft)
-            text_item.setFlags(text_item.flags() | Qt.ItemIsEditable)
-            text_item.setData(Qt.UserRole, original_row_number)
-            self.results_table.setItem(visible_row_index, 0, text_item)
-
-            conf_val = result.get('confidence', float('nan'))
-            conf_str = f"{conf_val:.2f}" if not math.isnan(conf_val) else "N/A"
-            confidence_item = QTableWidgetItem(conf_str)
-            confidence_item.setTextAlignment(Qt.AlignCenter)
-            confidence_item.setFlags(confidence_item.flags() & ~Qt.ItemIsEditable)
-            confidence_item.setData(Qt.UserRole, original_row_number)
-            self.results_table.setItem(visible_row_index, 1, confidence_item)
-
-            coord_str = str(result.get('coordinates', 'N/A'))
-            coord_item = QTableWidgetItem(coord_str)
-            coord_item.setTextAlignment(Qt.AlignCenter)
-            coord_item.setFlags(coord_item.flags() & ~Qt.ItemIsEditable)
-            coord_item.setData(Qt.UserRole, original_row_number)
-            self.results_table.setItem(visible_row_index, 2, coord_item)
-
-            file_item = QTableWidgetItem(result.get('filename', 'N/A'))
-            file_item.setTextAlignment(Qt.AlignCenter)
-            file_item.setFlags(file_item.flags() & ~Qt.ItemIsEditable)
-            file_item.setData(Qt.UserRole, original_row_number)
-            self.results_table.setItem(visible_row_index, 3, file_item)
-
-            row_num_display_item = QTableWidgetItem(display_row_number)
-            row_num_display_item.setTextAlignment(Qt.AlignCenter)
-            row_num_display_item.setFlags(row_num_display_item.flags() & ~Qt.ItemIsEditable)
-            row_num_display_item.setData(Qt.UserRole, original_row_number)
-            self.results_table.setItem(visible_row_index, 4, row_num_display_item)
-
-            delete_btn = QPushButton(qta.icon('fa5s.trash-alt', color='red'), "")
-            delete_btn.setFixedSize(30, 30)
-            delete_btn.setStyleSheet(DELETE_ROW_STYLES)
-            container = QWidget()
-            layout = QHBoxLayout(container); layout.addStretch(); layout.addWidget(delete_btn); layout.setContentsMargins(0, 0, 5, 0)
-            delete_btn.clicked.connect(lambda _, rn=original_row_number: self.main_window.delete_row(rn))
-            self.results_table.setCellWidget(visible_row_index, 5, container)
-        self.results_table.blockSignals(False)
-        self.update_column_resize_modes()
+        # Header resize modes and widths survive model resets, so only focus changes reapply them
+        self.results_model.refresh()
         # Refresh find widget if visible to update matches for new profile text
         # Use a delay to ensure table is fully updated before searching/highlighting
         if self.main_window.find_replace_widget.isVisible(): 
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(300, lambda: self.main_window.find_replace_widget.find_text())
+            self._find_refresh_timer.start()
 
-    def on_table_focus_changed(self, currentRow, currentColumn, previousRow, previousColumn):
+    def on_table_focus_changed(self, current, previous):
         """
         Handles dynamic column resizing when the user changes the focused cell.
         The focused column is expanded, and others are shrunk.
         """
+        currentColumn = current.column()
         # Ignore focus changes on the last column (delete button)
-        if currentColumn == self.results_table.columnCount() - 1:
+        if currentColumn == OcrResultsModel.DELETE_COLUMN:
             return
 
         if currentColumn >= 0 and currentColumn != self.focused_column:
@@ -281,7 +378,8 @@ class ResultsWidget(QWidget):
         stretches, while others become fixed-width.
         """
         header = self.results_table.horizontalHeader()
-        for col_index in range(self.results_table.columnCount() - 1):
+        self.results_table.setUpdatesEnabled(False) # One repaint for all five mode/width changes
+        for col_index in range(OcrResultsModel.DELETE_COLUMN):
             if col_index == self.focused_column:
                 header.setSectionResizeMode(col_index, QHeaderView.Stretch)
             else:
@@ -297,63 +395,41 @@ class ResultsWidget(QWidget):
                     self.results_table.setColumnWidth(col_index, 150)
                 elif col_index == 4:  # Row Number
                     self.results_table.setColumnWidth(col_index, 80)
+        self.results_table.setUpdatesEnabled(True)
 
-    def on_cell_changed(self, row, column):
-        item = self.results_table.item(row, column)
-        if not item: return
-        original_row_number = item.data(Qt.UserRole)
-        if original_row_number is None: return
-
-        if column == 0:
-             new_text = item.text()
-             self.main_window.update_ocr_text(original_row_number, new_text)
-             self._update_simple_view_text_if_visible(original_row_number, new_text)
+    def on_cell_changed(self, original_row_number, new_text):
+        """SLOT: A text cell was edited in the table."""
+        self.main_window.update_ocr_text(original_row_number, new_text)
+        self._update_simple_view_text_if_visible(original_row_number, new_text)
 
     def scroll_to_row(self, row_number):
         """Scrolls the active view to make the specified row_number visible, preferably centered."""
         found = False
-        try:
-            target_rn_float = float(row_number)
-        except (ValueError, TypeError):
-            return False
-
         if self.main_window.advanced_mode_check.isChecked():
-            for row in range(self.results_table.rowCount()):
-                item = self.results_table.item(row, 0)
-                if item and item.data(Qt.UserRole) is not None:
-                    try:
-                        if math.isclose(float(item.data(Qt.UserRole)), target_rn_float):
-                            item_rect = self.results_table.visualRect(self.results_table.indexFromItem(item))
-                            viewport_rect = self.results_table.viewport().rect()
-                            if not viewport_rect.contains(item_rect):
-                                self.results_table.scrollToItem(item, QAbstractItemView.PositionAtCenter)
-                            found = True
-                            break
-                    except (ValueError, TypeError):
-                        continue
+            row = self.results_model.row_for_row_number(row_number)
+            if row is not None:
+                # Plain header arithmetic; only rows not fully on screen pay for scrollTo's geometry work
+                row_top = self.results_table.rowViewportPosition(row)
+                if row_top < 0 or row_top + self.results_table.rowHeight(row) > self.results_table.viewport().height():
+                    self.results_table.scrollTo(self.results_model.index(row, 0), QAbstractItemView.PositionAtCenter)
+                found = True
         else:
-            for i in range(self.simple_scroll_layout.count()):
-                widget = self.simple_scroll_layout.itemAt(i).widget()
-                if widget and widget.property("ocr_row_number") is not None:
-                    try:
-                        if math.isclose(float(widget.property("ocr_row_number")), target_rn_float):
-                            scrollbar = self.simple_scroll.verticalScrollBar()
-                            viewport_height = self.simple_scroll.viewport().height()
-                            current_scroll_y = scrollbar.value()
-
-                            widget_y = widget.y()
-                            widget_height = widget.height()
-
-                            is_visible = (widget_y >= current_scroll_y) and (widget_y + widget_height <= current_scroll_y + viewport_height)
-                            if not is_visible:
-                                target_scroll_y = widget_y + (widget_height / 2) - (viewport_height / 2)
-                                clamped_scroll_y = max(scrollbar.minimum(), min(int(target_scroll_y), scrollbar.maximum()))
-                                scrollbar.setValue(clamped_scroll_y)
-                            
-                            found = True
-                            break
-                    except (ValueError, TypeError):
-                        continue
+            widget = self.simple_row_container(row_number)
+            if widget is not None:
+                scrollbar = self.simple_scroll.verticalScrollBar()
+                viewport_height = self.simple_scroll.viewport().height()
+                current_scroll_y = scrollbar.value()
+
+                widget_y = widget.y()
+                widget_height = widget.height()
+
+                is_visible = (widget_y >= current_scroll_y) and (widget_y + widget_height <= current_scroll_y + viewport_height)
+                if not is_visible:
+                    target_scroll_y = widget_y + (widget_height / 2) - (viewport_height / 2)
+                    clamped_scroll_y = max(scrollbar.minimum(), min(int(target_scroll_y), scrollbar.maximum()))
+                    scrollbar.setValue(clamped_scroll_y)
+                
+                found = True
         
         if not found:
             print(f"Info: Could not find row {row_number} in the current results view to scroll to.")
@@ -361,58 +437,39 @@ class ResultsWidget(QWidget):
         return found
 
     def _update_table_cell_if_visible(self, original_row_number, column, new_value):
-        for row in range(self.results_table.rowCount()):
-            item = self.results_table.item(row, column)
-            if item and item.data(Qt.UserRole) == original_row_number:
-                if item.text() == str(new_value):
-                    break
-
-                self.results_table.blockSignals(True)
-                item.setText(str(new_value))
-                self.results_table.blockSignals(False)
-                break
+        """Repaints one table cell; the model already holds new_value, so only the view needs telling."""
+        self.results_model.refresh_row(original_row_number, column, column)
 
     def _update_simple_view_text_if_visible(self, original_row_number, new_text):
-        for i in range(self.simple_scroll_layout.count()):
-             widget = self.simple_scroll_layout.itemAt(i).widget()
-             if isinstance(widget, QWidget) and widget.property("ocr_row_number") == original_row_number:
-                 text_edit = widget.findChild(QTextEdit)
-                 if text_edit:
-                     if text_edit.toPlainText() != new_text:
-                         text_edit.blockSignals(True)
-                         text_edit.setText(new_text)
-                         text_edit.blockSignals(False)
-                 break
+        widget = self.simple_row_container(original_row_number)
+        # Placeholders read the model when they are built, so only built rows need updating
+        if widget is not None and widget not in self._unbuilt_simple_rows:
+             text_edit = widget.findChild(QTextEdit)
+             if text_edit:
+                 if text_edit.toPlainText() != new_text:
+                     text_edit.blockSignals(True)
+                     text_edit.setText(new_text)
+                     text_edit.blockSignals(False)
 
     def combine_selected_rows(self):
-        selected_ranges = self.results_table.selectedRanges()
-        if not selected_ranges: return
-
-        selected_original_row_numbers_raw = set()
-        for r in selected_ranges:
-            for row in range(r.topRow(), r.bottomRow() + 1):
-                item = self.results_table.item(row, 0)
-                if item:
-                    rn_raw = item.data(Qt.UserRole)
-                    if rn_raw is not None: selected_original_row_numbers_raw.add(rn_raw)
-
-        if len(selected_original_row_numbers_raw) < 2: return
-
-        selected_original_row_numbers = []
-        for rn_raw in selected_original_row_numbers_raw:
-            try: selected_original_row_numbers.append(float(rn_raw))
-            except (ValueError, TypeError): ErrorDialog.critical(self, "Error", "Invalid row number data."); return
-        selected_original_row_numbers.sort()
-
-        selected_results = []; filename_set = set(); contains_float = False
-        for rn_float in selected_original_row_numbers:
-            result, _ = self.main_window._find_result_by_row_number(rn_float)
-            if result and not result.get('is_deleted', False):
-                selected_results.append(result)
-                filename_set.add(result.get('filename'))
-                rn_orig = result.get('row_number')
-                if isinstance(rn_orig, float) and not rn_orig.is_integer(): contains_float = True
-            else: ErrorDialog.critical(self, "Error", f"Result {rn_float} not found/deleted."); return
+        selected_indexes = self.results_table.selectionModel().selectedIndexes()
+        if not selected_indexes: return
+
+        # The view's rows are the model's result dicts, so no per-row model scan is needed
+        selected_results = [self.results_model.result_at(row) for row in {index.row() for index in selected_indexes}]
+        if len(selected_results) < 2: return
+
+        try: selected_results.sort(key=lambda res: float(res['row_number']))
+        except (ValueError, TypeError): ErrorDialog.critical(self, "Error", "Invalid row number data."); return
+        selected_original_row_numbers = [float(res['row_number']) for res in selected_results]
+
+        filename_set = set(); contains_float = False
+        for result in selected_results:
+            if result.get('is_deleted', False):
+                ErrorDialog.critical(self, "Error", f"Result {result['row_number']} not found/deleted."); return
+            filename_set.add(result.get('filename'))
+            rn_orig = result['row_number']
+            if isinstance(rn_orig, float) and not rn_orig.is_integer(): contains_float = True
 
         if len(filename_set) > 1: QMessageBox.warning(self, "Warning", "Cannot combine rows from different files"); return
         if contains_float: QMessageBox.warning(self, "Combine Restriction", "Combining manually added rows is not supported yet."); return
@@ -420,8 +477,7 @@ class ResultsWidget(QWidget):
         is_adjacent = all(math.isclose(selected_original_row_numbers[i+1] - selected_original_row_numbers[i], 1.0) for i in range(len(selected_original_row_numbers) - 1))
         if not is_adjacent: QMessageBox.warning(self, "Warning", "Selected standard rows must be a contiguous sequence."); return
 
-        selected_results.sort(key=lambda x: float(x.get('row_number', float('inf'))))
-        combined_text_list = [self.main_window.get_display_text(res) for res in selected_results]
+        combined_text_list = [self.display_text(res) for res in selected_results]
         min_confidence = min(res.get('confidence', 0.0) for res in selected_results)
         first_result = selected_results[0]
         rows_to_delete = [res['row_number'] for res in selected_results[1:]]
@@ -433,13 +489,155 @@ class ResultsWidget(QWidget):
             rows_to_delete
         )
 
+class OcrResultsModel(QAbstractTableModel):
+    """Table model over the project's non-deleted OCR results; rows are formatted on demand in data()."""
+    textEdited = Signal(object, str) # (row_number, new_text) after the Text column is edited
+    HEADERS = ["Text", "Confidence", "Coordinates", "File", "Row Number", ""]
+    DELETE_COLUMN = 5
+
+    def __init__(self, main_window, display_text, parent=None):
+        super().__init__(parent)
+        self.main_window = main_window
+        self._display_text = display_text # Text-column formatter shared with the simple view's cache
+        self._rows = [] # Snapshot of model.visible_results() taken by refresh()
+        self._row_index = {} # _row_key(row_number) -> view row
+        self._text_header = self.HEADERS[0]
+
+    def refresh(self):
+        """Re-reads the visible results and active profile; the view re-queries only the cells it shows.
+        Resets the model only when rows were added, removed or reordered, so selection and scroll survive text/profile changes."""
+        rows = self.main_window.model.visible_results()
+        active_profile = self.main_window.model.active_profile_name
+        text_header = f"Text ({active_profile})" if active_profile != "Original" else "Text (Original OCR)"
+        if len(rows) == len(self._rows) and all(a['row_number'] == b['row_number'] for a, b in zip(rows, self._rows)):
+            self._rows = rows
+            if text_header != self._text_header:
+                self._text_header = text_header
+                self.headerDataChanged.emit(Qt.Horizontal, 0, 0)
+            self.refresh_columns(0, self.DELETE_COLUMN - 1)
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self._row_index = {_row_key(result['row_number']): row for row, result in enumerate(self._rows)}
+        self._text_header = text_header
+        self.endResetModel()
+
+    def refresh_row(self, row_number, first_column=0, last_column=DELETE_COLUMN - 1):
+        """Repaints the given columns of the row showing row_number, if it is listed."""
+        row = self.row_for_row_number(row_number)
+        if row is not None:
+            self.dataChanged.emit(self.index(row, first_column), self.index(row, last_column))
+
+    def refresh_columns(self, first_column, last_column):
+        """Repaints whole columns without touching the row layout."""
+        if self._rows:
+            self.dataChanged.emit(self.index(0, first_column), self.index(len(self._rows) - 1, last_column))
+
+    def result_at(self, row):
+        return self._rows[row]
+
+    def row_number_at(self, row):
+        return self._rows[row]['row_number'] if 0 <= row < len(self._rows) else None
+
+    def row_for_row_number(self, row_number):
+        """Returns the view row showing row_number, or None."""
+        return _lookup_row(self._row_index, row_number)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole: return None
+        if orientation == Qt.Horizontal:
+            return self._text_header if section == 0 else self.HEADERS[section]
+        return section + 1
+
+    def flags(self, index):
+        flags = super().flags(index)
+        return flags | Qt.ItemIsEditable if index.column() == 0 else flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid(): return None
+        result = self._rows[index.row()]
+        column = index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if column == 0:
+                return self._display_text(result)
+            if column == 1:
+                conf_val = result.get('confidence', float('nan'))
+                return f"{conf_val:.2f}" if not math.isnan(conf_val) else "N/A"
+            if column == 2:
+                return str(result.get('coordinates', 'N/A'))
+            if column == 3:
+                return result.get('filename', 'N/A')
+            if column == 4:
+                return _format_row_number(result['row_number'])
+            return None
+        if role == Qt.UserRole:
+            return result['row_number']
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignTop | Qt.AlignLeft) if column == 0 else int(Qt.AlignCenter)
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or index.column() != 0 or not index.isValid(): return False
+        if value == self.data(index, Qt.EditRole): return False
+        self.textEdited.emit(self._rows[index.row()]['row_number'], value)
+        self.dataChanged.emit(index, index)
+        return True
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """Paints the trash icon for the delete column instead of hosting a QPushButton in every row."""
+    deleteRequested = Signal(object) # original row_number
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pixmap = qta.icon('fa5s.trash-alt', color='red').pixmap(20, 20) # Rendered once, blitted per row
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index) # Selection/hover background; the column has no display text
+        painter.drawPixmap(self.icon_rect(option.rect), self._pixmap)
+
+    def editorEvent(self, event, model, option, index):
+        # Only a release over the icon itself counts as a click, like the old button
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton \
+                and self.icon_rect(option.rect).contains(event.position().toPoint()):
+            self.deleteRequested.emit(index.data(Qt.UserRole))
+            return True
+        return super().editorEvent(event, model, option, index)
+
+    @staticmethod
+    def icon_rect(cell_rect):
+        """20px icon in a 30px box, right-aligned with a 5px margin like the old button container."""
+        return QRect(cell_rect.right() - 29, cell_rect.center().y() - 10, 20, 20)
+
 class TextEditDelegate(QStyledItemDelegate):
+    POOL_SIZE = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._editor_pool: list[QTextEdit] = [] # Closed editors kept for reuse; tabbing through cells skips QTextEdit setup
+
     def createEditor(self, parent, option, index):
+        if self._editor_pool:
+            editor = self._editor_pool.pop()
+            editor.setParent(parent)
+            return editor
         editor = QTextEdit(parent)
         editor.setAcceptRichText(False)
         editor.setLineWrapMode(QTextEdit.WidgetWidth)
         return editor
 
+    def destroyEditor(self, editor, index):
+        if len(self._editor_pool) >= self.POOL_SIZE:
+            super().destroyEditor(editor, index); return
+        editor.hide(); editor.setParent(None)
+        editor.document().clear() # Also drops the undo stack of the finished edit
+        self._editor_pool.append(editor)
+
     def setEditorData(self, editor, index):
         text = index.model().data(index, Qt.DisplayRole)
         editor.setPlainText(text)
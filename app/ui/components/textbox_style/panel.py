@@ -1,9 +1,15 @@
 import os
 import json
-import functools
+# orjson is optional; it only speeds up preset (de)serialization
+try:
+    import orjson
+    _dumps = lambda obj: orjson.dumps(obj).decode()
+    _loads = orjson.loads # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the except clauses below still apply
+except ImportError:
+    _dumps, _loads = json.dumps, json.loads
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QPushButton, QFrame,
                              QGroupBox, QHBoxLayout, QScrollArea)
-from PySide6.QtCore import Qt, Signal, QSettings
+from PySide6.QtCore import Qt, Signal, Slot, QSettings, QTimer, QSignalBlocker, QCoreApplication
 from PySide6.QtGui import QColor
 import qtawesome as qta
 from app.ui.components.textbox_style.preset import PresetButton
@@ -11,19 +17,39 @@ from app.ui.components.textbox_style.preset import PresetButton
 from assets import DEFAULT_GRADIENT, TEXT_BOX_STYLE_PANEL_STYLE
 from app.ui.dialogs.BetterColorDialog.MainDialog import CustomColorDialog
 from .shape_panel import ShapeStylePanel
-from .typography_panel import TypographyStylePanel
+from .typography_panel import TypographyStylePanel, start_custom_font_scan
+
+_DEFAULT_GRADIENT_KEYS = frozenset(DEFAULT_GRADIENT)
+_NESTED_STYLE_KEYS = frozenset({'bg_gradient', 'text_gradient'})
+_MISSING = object()
+_REQUIRED_STYLE_KEYS = frozenset({'fill_type', 'bg_color', 'bg_gradient', 'text_color_type',
+                                  'text_color', 'text_gradient', 'font_style'})
+
+def _with_gradient_defaults(gradient):
+    """DEFAULT_GRADIENT overlaid with gradient; copy() + update() is cheaper than {**a, **b}."""
+    merged = DEFAULT_GRADIENT.copy()
+    if gradient: merged.update(gradient)
+    return merged
+
+def _clone_style(style):
+    """Independent copy of a style dict. Nested values are only ever flat dicts (the gradients), so one level suffices."""
+    return {k: (v.copy() if type(v) is dict else v) for k, v in style.items()}
 
 def get_style_diff(style_dict, base_style_dict):
-    """Compares a style dict to a base and returns only the changed values."""
+    """Compares a style dict to a base and returns only the changed values.
+    The style schema nests only the two gradient dicts, so they get an inlined second level instead of recursion."""
+    if style_dict is base_style_dict or style_dict == base_style_dict:
+        return {} # Equal trees have no diff; dict == compares in C and stops at the first difference
     diff = {}
     for key, value in style_dict.items():
-        if key not in base_style_dict or base_style_dict[key] != value:
-            if isinstance(value, dict) and key in base_style_dict and isinstance(base_style_dict[key], dict):
-                nested_diff = get_style_diff(value, base_style_dict[key])
-                if nested_diff:
-                    diff[key] = nested_diff
-            else:
-                diff[key] = value
+        base_value = base_style_dict.get(key, _MISSING)
+        if base_value == value: continue
+        if key in _NESTED_STYLE_KEYS and isinstance(value, dict) and isinstance(base_value, dict):
+            nested_diff = {k: v for k, v in value.items() if base_value.get(k, _MISSING) != v}
+            if nested_diff:
+                diff[key] = nested_diff
+        else:
+            diff[key] = value
     return diff
 
 class TextBoxStylePanel(QWidget):
@@ -39,29 +65,41 @@ class TextBoxStylePanel(QWidget):
         self.setObjectName("TextBoxStylePanel")
         self.setMinimumWidth(400)
         self.settings = QSettings("Liiesl", "EasyScanlate")
+        self.settings.setAtomicSyncRequired(False) # File backends write in place instead of via temp file + rename
         self.presets = []
+        self._preset_widgets = [] # PresetButton per entry in self.presets, in layout order
+        self._preset_json = [] # JSON of each entry in self.presets, kept in step with it like _preset_widgets
+        self._preset_blob = None # JSON array last written to style_presets_json, mirrors the settings
+        # Preset edits are written to QSettings right away but flushed to disk once per burst
+        self._settings_sync_timer = QTimer(self)
+        self._settings_sync_timer.setSingleShot(True)
+        self._settings_sync_timer.setInterval(500)
+        self._settings_sync_timer.timeout.connect(self.settings.sync)
+        QCoreApplication.instance().aboutToQuit.connect(self._flush_settings)
         self._original_default_style = default_style if default_style else {}
         self._default_style = self._ensure_gradient_defaults(self._original_default_style)
         self._updating_controls = False
         self.selected_style_info = None
         
+        self._sub_panels_built = False
+        start_custom_font_scan() # Fonts must be registered before text boxes render, even if the sub-panels never get built
         self.init_ui()
-        self.update_style_panel(self._default_style)
-        self._load_presets()
 
     def _ensure_gradient_defaults(self, style_dict):
-        """Ensures a style dictionary has default gradient fields."""
+        """Ensures a style dictionary has default gradient fields. Complete styles are returned as-is (callers only read them)."""
+        if style_dict and _REQUIRED_STYLE_KEYS <= style_dict.keys() \
+                and _DEFAULT_GRADIENT_KEYS <= style_dict['bg_gradient'].keys() \
+                and _DEFAULT_GRADIENT_KEYS <= style_dict['text_gradient'].keys():
+            return style_dict
         style = style_dict.copy() if style_dict else {}
         # Fill defaults
         if 'fill_type' not in style: style['fill_type'] = 'solid'
         if 'bg_color' not in style: style['bg_color'] = '#ffffffff'
-        if 'bg_gradient' not in style: style['bg_gradient'] = {}
-        style['bg_gradient'] = {**DEFAULT_GRADIENT, **style['bg_gradient']}
+        style['bg_gradient'] = _with_gradient_defaults(style.get('bg_gradient'))
         # Text defaults
         if 'text_color_type' not in style: style['text_color_type'] = 'solid'
         if 'text_color' not in style: style['text_color'] = '#ff000000'
-        if 'text_gradient' not in style: style['text_gradient'] = {}
-        style['text_gradient'] = {**DEFAULT_GRADIENT, **style['text_gradient']}
+        style['text_gradient'] = _with_gradient_defaults(style.get('text_gradient'))
         # Font style default
         if 'font_style' not in style: style['font_style'] = 'Regular'
         return style
@@ -95,15 +133,47 @@ class TextBoxStylePanel(QWidget):
         scroll_layout.setContentsMargins(0, 5, 5, 5)
         scroll_layout.setSpacing(12)
 
+        # Sub-panels and presets are built on first use (see _ensure_sub_panels)
+        self._scroll_layout = scroll_layout
+
+        # --- Finish Scroll Area ---
+        scroll_layout.addStretch()
+        scroll_area.setWidget(scroll_content)
+        main_layout.addWidget(scroll_area)
+
+        # --- Button Bar ---
+        button_container = QWidget()
+        button_container.setObjectName("buttonContainer")
+        button_layout = QHBoxLayout(button_container)
+        button_layout.setContentsMargins(0, 10, 0, 0)
+        self.btn_reset = QPushButton("Reset")
+        self.btn_reset.setObjectName("resetButton")
+        self.btn_reset.clicked.connect(self.reset_style)
+        button_layout.addWidget(self.btn_reset)
+        button_layout.addSpacing(10)
+        self.btn_apply = QPushButton("Apply")
+        self.btn_apply.setObjectName("applyButton")
+        self.btn_apply.clicked.connect(self.apply_style)
+        button_layout.addWidget(self.btn_apply)
+
+        # The large stylesheet is removed from here. Only panel-specific styles remain.
+        self.setStyleSheet(TEXT_BOX_STYLE_PANEL_STYLE)
+
+    def _ensure_sub_panels(self):
+        """Builds the shape/typography panels and presets the first time the panel is shown or used.
+        The panel starts hidden and many sessions never select a text box, so startup skips the whole control tree."""
+        if self._sub_panels_built:
+            return
+        self._sub_panels_built = True
         # --- Instantiate and Add Sub-Panels ---
-        self.shape_panel = ShapeStylePanel(color_chooser_fn=self.choose_color)
-        self.typography_panel = TypographyStylePanel(color_chooser_fn=self.choose_color)
+        self.shape_panel = ShapeStylePanel(color_chooser_fn=self.pick_color)
+        self.typography_panel = TypographyStylePanel(color_chooser_fn=self.pick_color)
         
         self.shape_panel.style_changed.connect(self.style_changed_handler)
         self.typography_panel.style_changed.connect(self.style_changed_handler)
         
-        scroll_layout.addWidget(self.shape_panel)
-        scroll_layout.addWidget(self.typography_panel)
+        self._scroll_layout.insertWidget(0, self.shape_panel)
+        self._scroll_layout.insertWidget(1, self.typography_panel)
         # --- Presets Group (Inside Scroll Area) ---
         presets_group = QGroupBox("Presets")
         presets_group.setObjectName("styleGroup")
@@ -127,30 +197,16 @@ class TextBoxStylePanel(QWidget):
         self.btn_add_preset.setObjectName("addPresetButton")
         self.btn_add_preset.clicked.connect(self._add_preset)
         presets_main_layout.addWidget(self.btn_add_preset)
-        scroll_layout.addWidget(presets_group)
-
-        # --- Finish Scroll Area ---
-        scroll_layout.addStretch()
-        scroll_area.setWidget(scroll_content)
-        main_layout.addWidget(scroll_area)
+        self._scroll_layout.insertWidget(2, presets_group)
 
-        # --- Button Bar ---
-        button_container = QWidget()
-        button_container.setObjectName("buttonContainer")
-        button_layout = QHBoxLayout(button_container)
-        button_layout.setContentsMargins(0, 10, 0, 0)
-        self.btn_reset = QPushButton("Reset")
-        self.btn_reset.setObjectName("resetButton")
-        self.btn_reset.clicked.connect(self.reset_style)
-        button_layout.addWidget(self.btn_reset)
-        button_layout.addSpacing(10)
-        self.btn_apply = QPushButton("Apply")
-        self.btn_apply.setObjectName("applyButton")
-        self.btn_apply.clicked.connect(self.apply_style)
-        button_layout.addWidget(self.btn_apply)
+        with QSignalBlocker(self.shape_panel), QSignalBlocker(self.typography_panel):
+            self.shape_panel.set_style(self._default_style, DEFAULT_GRADIENT)
+            self.typography_panel.set_style(self._default_style, DEFAULT_GRADIENT)
+        self._load_presets()
 
-        # The large stylesheet is removed from here. Only panel-specific styles remain.
-        self.setStyleSheet(TEXT_BOX_STYLE_PANEL_STYLE)
+    def showEvent(self, event):
+        self._ensure_sub_panels()
+        super().showEvent(event)
 
     def get_current_style(self):
         """
@@ -159,15 +215,15 @@ class TextBoxStylePanel(QWidget):
         Returns:
             dict: The complete, current style dictionary.
         """
+        self._ensure_sub_panels()
         shape_style = self.shape_panel.get_style()
         
         default_font = self._default_style.get('font_family', "Arial")
         default_font_style = self._default_style.get('font_style', "Regular")
         typography_style = self.typography_panel.get_style(default_font, default_font_style)
         
-        # Merge the dictionaries
-        full_style = {**shape_style, **typography_style}
-        return full_style
+        # Merge into a new dict; the sub-panels' dicts are left untouched in case they are reused
+        return shape_style | typography_style
 
     def update_style_panel(self, style_dict_in):
         """
@@ -182,21 +238,22 @@ class TextBoxStylePanel(QWidget):
         else:
             style_dict = self._ensure_gradient_defaults(style_dict_in)
             
-        self._updating_controls = True
+        self._ensure_sub_panels()
+        self._updating_controls = True # Safety net; the blockers below keep the sub-panels' style_changed from reaching us
         self.selected_style_info = style_dict
 
-        self.shape_panel.set_style(style_dict, DEFAULT_GRADIENT)
-        self.typography_panel.set_style(style_dict, DEFAULT_GRADIENT)
+        with QSignalBlocker(self.shape_panel), QSignalBlocker(self.typography_panel):
+            self.shape_panel.set_style(style_dict, DEFAULT_GRADIENT)
+            self.typography_panel.set_style(style_dict, DEFAULT_GRADIENT)
 
         self._updating_controls = False
         if style_dict_in:
             self.show()
 
     def style_changed_handler(self):
-        """Handles the style_changed signal from sub-panels."""
+        """Handles the style_changed signal from sub-panels; they already coalesce bursts, so this emits right away."""
         if not self._updating_controls:
-            current_style = self.get_current_style()
-            self.style_changed.emit(current_style)
+            self.style_changed.emit(self.get_current_style())
 
     def apply_style(self):
         """Emits the current style to be applied."""
@@ -207,24 +264,10 @@ class TextBoxStylePanel(QWidget):
         self.update_style_panel(self._default_style)
         self.style_changed_handler()
 
-    def choose_color(self, button):
-        """
-        Opens a custom color dialog and applies the chosen color to the button.
-        This method is passed to sub-panels to handle their color buttons.
-        """
-        style = button.styleSheet()
-        try:
-            start = style.find("background-color:") + len("background-color:")
-            end = style.find(";", start)
-            current_color = QColor(style[start:end].strip())
-        except:
-            current_color = QColor(0, 0, 0)
-            
-        color = CustomColorDialog.getColor(initial_color=current_color, parent=self)
-        
-        if color is not None and color.isValid():
-            button.setStyleSheet(f"background-color: {color.name(QColor.HexArgb)}; border: 1px solid #60666E; border-radius: 3px;")
-            self.style_changed_handler()
+    def pick_color(self, initial_color):
+        """Opens the color dialog at initial_color and returns the chosen QColor, or None if cancelled."""
+        color = CustomColorDialog.getColor(initial_color=initial_color, parent=self)
+        return color if color is not None and color.isValid() else None
 
     def clear_and_hide(self):
         self.selected_style_info = None
@@ -236,47 +279,88 @@ class TextBoxStylePanel(QWidget):
             child = self.presets_buttons_layout.takeAt(0)
             if child.widget():
                 child.widget().deleteLater()
+        self._preset_widgets = []
         
         self.presets_buttons_layout.addStretch() # Keep add button to the right
-        for i, style in reversed(list(enumerate(self.presets))):
-            preset_button = PresetButton(i, self)
-            preset_button.set_style(style)
-            preset_button.clicked.connect(functools.partial(self._on_preset_clicked, i))
-            preset_button.overwrite_requested.connect(self._overwrite_preset)
-            preset_button.delete_requested.connect(self._delete_preset)
-            self.presets_buttons_layout.insertWidget(0, preset_button)
+        for style in self.presets:
+            self._add_preset_widget(style)
+
+    # Single-preset edits touch only the affected button; buttons read their index at click time
+    def _add_preset_widget(self, style):
+        index = len(self._preset_widgets)
+        preset_button = PresetButton(index, self)
+        preset_button.set_style(style)
+        preset_button.clicked.connect(self._on_preset_button_clicked)
+        preset_button.overwrite_requested.connect(self._overwrite_preset)
+        preset_button.delete_requested.connect(self._delete_preset)
+        self.presets_buttons_layout.insertWidget(index, preset_button) # Before the trailing stretch
+        self._preset_widgets.append(preset_button)
+
+    def _update_preset_widget(self, index, style):
+        self._preset_widgets[index].set_style(style)
+
+    def _remove_preset_widget(self, index):
+        preset_button = self._preset_widgets.pop(index)
+        self.presets_buttons_layout.removeWidget(preset_button)
+        preset_button.deleteLater()
+        for i in range(index, len(self._preset_widgets)):
+            self._preset_widgets[i].index = i
 
     def _load_presets(self):
         self.presets = []
+        self._preset_json = []
+        self._preset_blob = self.settings.value("style_presets_json", None)
+        if self._preset_blob is None:
+            self._load_old_format_presets()
+        else:
+            try:
+                self.presets = [preset for preset in _loads(self._preset_blob) if isinstance(preset, dict)]
+                self._preset_json = [_dumps(preset) for preset in self.presets]
+            except (json.JSONDecodeError, TypeError):
+                print("Warning: Could not load style presets.")
+        self._rebuild_preset_ui()
+
+    def _load_old_format_presets(self):
+        """Reads presets stored by older versions as style_presets/preset_{i} keys,
+        then rewrites them as the single JSON value and drops the old group."""
         self.settings.beginGroup("style_presets")
         i = 0
-        while True:
-            key = f"preset_{i}"
-            preset_str = self.settings.value(key, None)
-            if preset_str is None:
-                break
+        while (preset_str := self.settings.value(f"preset_{i}", None)) is not None:
             try:
-                self.presets.append(json.loads(preset_str))
+                self.presets.append(_loads(preset_str))
+                self._preset_json.append(preset_str)
             except (json.JSONDecodeError, TypeError):
                 print(f"Warning: Could not load preset at index {i}.")
             i += 1
         self.settings.endGroup()
-        self._rebuild_preset_ui()
+        if i:
+            self._save_presets()
+            self.settings.remove("style_presets")
+
+    def _flush_settings(self):
+        if self._settings_sync_timer.isActive():
+            self._settings_sync_timer.stop()
+            self.settings.sync()
 
     def _save_presets(self):
-        self.settings.beginGroup("style_presets")
-        self.settings.remove("") 
-        for i, preset in enumerate(self.presets):
-            if preset:
-                self.settings.setValue(f"preset_{i}", json.dumps(preset))
-        self.settings.endGroup()
-        self.settings.sync()
+        """Stores all presets as one JSON array value, joined from each preset's cached JSON."""
+        blob = "[" + ", ".join(self._preset_json) + "]"
+        if blob == self._preset_blob:
+            return
+        self.settings.setValue("style_presets_json", blob)
+        self._preset_blob = blob
+        self._settings_sync_timer.start()
+
+    @Slot()
+    def _on_preset_button_clicked(self):
+        """Shared clicked slot for all preset buttons; the sender carries its current index."""
+        self._on_preset_clicked(self.sender().index)
 
     def _on_preset_clicked(self, index):
         if not (0 <= index < len(self.presets)): return
         style_diff = self.presets[index]
         if style_diff is None: return
-        full_style = json.loads(json.dumps(self._default_style))
+        full_style = _clone_style(self._default_style)
         for key, value in style_diff.items():
             if isinstance(value, dict) and key in full_style:
                 full_style[key].update(value)
@@ -289,19 +373,22 @@ class TextBoxStylePanel(QWidget):
         current_style = self.get_current_style()
         style_diff = get_style_diff(current_style, self._default_style)
         self.presets.append(style_diff)
+        self._preset_json.append(_dumps(style_diff))
         self._save_presets()
-        self._rebuild_preset_ui()
+        self._add_preset_widget(style_diff)
 
     def _overwrite_preset(self, index):
         if not (0 <= index < len(self.presets)): return
         current_style = self.get_current_style()
         style_diff = get_style_diff(current_style, self._default_style)
         self.presets[index] = style_diff
+        self._preset_json[index] = _dumps(style_diff)
         self._save_presets()
-        self._rebuild_preset_ui()
+        self._update_preset_widget(index, style_diff)
 
     def _delete_preset(self, index):
         if not (0 <= index < len(self.presets)): return
         self.presets.pop(index)
+        self._preset_json.pop(index)
         self._save_presets()
-        self._rebuild_preset_ui()
\ No newline at end of file
+        self._remove_preset_widget(index)
\ No newline at end of file
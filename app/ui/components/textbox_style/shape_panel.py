@@ -1,9 +1,40 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QComboBox, QSpinBox, 
                              QHBoxLayout, QPushButton, QFrame)
-from PySide6.QtCore import Signal, Qt, QSize, QPoint
-from PySide6.QtGui import QColor, QIcon, QPixmap, QPainter, QBrush, QPolygon
+from PySide6.QtCore import Signal, Slot, Qt, QSize, QPoint, QTimer, QSignalBlocker
+from PySide6.QtGui import QColor, QIcon, QPixmap, QPixmapCache, QPainter, QPainterPath, QBrush, QPolygon, QPolygonF
 from assets import SHAPE_PANEL_STYLE
 
+# Box with a speech-bubble tail, for the polygon shape icon
+_POLY_POINTS = QPolygon([
+    QPoint(6, 8), QPoint(26, 8), QPoint(26, 24),
+    QPoint(16, 24), QPoint(12, 28), QPoint(12, 24), QPoint(6, 24)
+])
+
+def _build_shape_paths():
+    """Builds the outlines drawn by the 32x32 shape selection icons."""
+    rect = QPainterPath()
+    rect.addRect(5, 8, 22, 16) # x, y, width, height
+    rounded = QPainterPath()
+    rounded.addRoundedRect(5, 8, 22, 16, 5, 5) # x, y, w, h, x-radius, y-radius
+    poly = QPainterPath()
+    poly.addPolygon(QPolygonF(_POLY_POINTS))
+    poly.closeSubpath()
+    return {"rect": rect, "rounded": rounded, "poly": poly}
+
+_SHAPE_PATHS = _build_shape_paths()
+
+# Stroke button preview: border width, border color, hover border color
+_STROKE_BUTTON_STYLE = """
+    QPushButton#colorButton {
+        background-color: transparent;
+        border: %dpx solid %s;
+        border-radius: 3px;
+    }
+    QPushButton#colorButton:hover {
+        border-color: %s;
+    }
+"""
+
 class ShapeStylePanel(QWidget):
     """
     A widget panel for managing the shape, fill, and stroke styles of a text box.
@@ -11,68 +42,70 @@ class ShapeStylePanel(QWidget):
     """
     style_changed = Signal()
 
+    # Shape icons are constant, so they are painted once and shared by every panel
+    _ICON_RECT = None
+    _ICON_ROUNDED = None
+    _ICON_POLY = None
+
     def __init__(self, color_chooser_fn, parent=None):
         """
         Initializes the shape style panel.
         
         Args:
             color_chooser_fn (function): A function to be called to open a color dialog.
-                                         This function should accept a QPushButton as an argument.
+                                         It receives the current QColor and returns the chosen
+                                         QColor, or None if the dialog was cancelled.
             parent (QWidget, optional): The parent widget. Defaults to None.
         """
         super().__init__(parent)
         self.setObjectName("ShapeStylePanel")
         self._color_chooser_fn = color_chooser_fn
         self._updating_controls = False
+        self._last_gradient_state = None # Fill type the solid/gradient controls were last toggled for
+        self._stroke_style_cache = {} # (preview width, rgba) -> stroke button stylesheet
+        # Coalesces bursts of control changes (e.g. a held spinbox arrow) into one style_changed per event loop pass
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self.style_changed.emit)
         self.init_ui()
 
-    def _create_shape_icons(self):
-        """Creates QIcon objects for shape selection buttons."""
-        icon_size = QSize(32, 32)
-        base_color = QColor("#DDDDDD") # A light color for the icon shape
-
-        # --- Icon 1: Rectangle ---
-        pixmap_rect = QPixmap(icon_size)
-        pixmap_rect.fill(Qt.transparent)
-        p1 = QPainter(pixmap_rect)
-        p1.setRenderHint(QPainter.Antialiasing)
-        p1.setBrush(QBrush(base_color))
-        p1.setPen(Qt.NoPen)
-        p1.drawRect(5, 8, 22, 16) # x, y, width, height
-        p1.end()
-        self.icon_rect = QIcon(pixmap_rect) 
-
-        # --- Icon 2: Rounded Rectangle ---
-        pixmap_rounded = QPixmap(icon_size)
-        pixmap_rounded.fill(Qt.transparent)
-        p2 = QPainter(pixmap_rounded)
-        p2.setRenderHint(QPainter.Antialiasing)
-        p2.setBrush(QBrush(base_color))
-        p2.setPen(Qt.NoPen)
-        p2.drawRoundedRect(5, 8, 22, 16, 5, 5) # x, y, w, h, x-radius, y-radius
-        p2.end()
-        self.icon_rounded = QIcon(pixmap_rounded)
-
-        # --- Icon 3: Polygon ---
-        pixmap_poly = QPixmap(icon_size)
-        pixmap_poly.fill(Qt.transparent)
-        p3 = QPainter(pixmap_poly)
-        p3.setRenderHint(QPainter.Antialiasing)
-        p3.setBrush(QBrush(base_color))
-        p3.setPen(Qt.NoPen)
-        
-        points = QPolygon([
-            QPoint(6, 8), QPoint(26, 8), QPoint(26, 24),
-            QPoint(16, 24), QPoint(12, 28), QPoint(12, 24), QPoint(6, 24)
-        ])
-        
-        p3.drawPolygon(points)
-        p3.end()
-        self.icon_poly = QIcon(pixmap_poly)
+    @classmethod
+    def _get_shape_icons(cls):
+        """Returns the (rect, rounded, poly) QIcons for shape selection, creating them on first use."""
+        if cls._ICON_RECT is not None:
+            return cls._ICON_RECT, cls._ICON_ROUNDED, cls._ICON_POLY
+
+        brush = QBrush(QColor("#DDDDDD")) # A light color for the icon shape
+
+        # Pixmaps go through QPixmapCache so they outlive any single panel
+        icons = {}
+        for name, path in _SHAPE_PATHS.items():
+            key = f"shape_{name}_32"
+            pixmap = QPixmap()
+            if not QPixmapCache.find(key, pixmap):
+                pixmap = cls._paint_icon(path, brush)
+                QPixmapCache.insert(key, pixmap)
+            icons[name] = QIcon(pixmap)
+        cls._ICON_RECT, cls._ICON_ROUNDED, cls._ICON_POLY = icons["rect"], icons["rounded"], icons["poly"]
+        return cls._ICON_RECT, cls._ICON_ROUNDED, cls._ICON_POLY
+
+    @staticmethod
+    def _paint_icon(path, brush, size=32):
+        """Fills path with brush (antialiased, no outline) on a transparent size x size pixmap."""
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(brush)
+        painter.setPen(Qt.NoPen)
+        painter.drawPath(path)
+        painter.end()
+        return pixmap
 
     def init_ui(self):
         """Initializes the user interface for the shape panel."""
-        self._create_shape_icons()
+        self.icon_rect, self.icon_rounded, self.icon_poly = type(self)._get_shape_icons()
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -86,8 +119,7 @@ class ShapeStylePanel(QWidget):
         self.combo_fill_type = QComboBox()
         self.combo_fill_type.setObjectName("styleCombo")
         self.combo_fill_type.addItems(["Solid", "Linear Gradient"])
-        self.combo_fill_type.currentIndexChanged.connect(self._toggle_fill_gradient_controls)
-        self.combo_fill_type.currentIndexChanged.connect(self._on_style_changed)
+        self.combo_fill_type.currentIndexChanged.connect(self._on_fill_type_changed)
         main_layout.addWidget(self.combo_fill_type)
         
         self.solid_controls_widget = QWidget()
@@ -95,43 +127,15 @@ class ShapeStylePanel(QWidget):
         solid_controls_layout.setContentsMargins(0, 8, 0, 8)
         solid_controls_layout.setSpacing(10)
 
-        fill_layout = QVBoxLayout()
-        fill_layout.setSpacing(2)
-        fill_label = QLabel("Fill")
-        fill_label.setObjectName("tinyLabel")
-        fill_layout.addWidget(fill_label)
-        self.btn_bg_color = QPushButton("")
-        self.btn_bg_color.setObjectName("colorButton")
-        self.btn_bg_color.setFixedSize(48, 28)
-        self.btn_bg_color.clicked.connect(lambda: self._handle_color_choice(self.btn_bg_color))
-        fill_layout.addWidget(self.btn_bg_color)
-        solid_controls_layout.addLayout(fill_layout, 1)
-
-        stroke_width_layout = QVBoxLayout()
-        stroke_width_layout.setSpacing(2)
-        stroke_width_label = QLabel("Width")
-        stroke_width_label.setObjectName("tinyLabel")
-        stroke_width_layout.addWidget(stroke_width_label)
+        self.btn_bg_color = self._make_color_button(48, 28)
         self.spin_border_width = QSpinBox()
         self.spin_border_width.setObjectName("borderWidthSpinner")
         self.spin_border_width.setRange(0, 99)
         self.spin_border_width.setFixedHeight(28)
-        self.spin_border_width.valueChanged.connect(self._on_style_changed)
-        self.spin_border_width.valueChanged.connect(self._update_stroke_button_visuals)
-        stroke_width_layout.addWidget(self.spin_border_width)
-        solid_controls_layout.addLayout(stroke_width_layout, 1)
-
-        stroke_color_layout = QVBoxLayout()
-        stroke_color_layout.setSpacing(2)
-        stroke_color_label = QLabel("Stroke")
-        stroke_color_label.setObjectName("tinyLabel")
-        stroke_color_layout.addWidget(stroke_color_label)
-        self.btn_border_color = QPushButton("")
-        self.btn_border_color.setObjectName("colorButton")
-        self.btn_border_color.setFixedSize(48, 28)
-        self.btn_border_color.clicked.connect(lambda: self._handle_color_choice(self.btn_border_color))
-        stroke_color_layout.addWidget(self.btn_border_color)
-        solid_controls_layout.addLayout(stroke_color_layout, 1)
+        self.spin_border_width.valueChanged.connect(self._on_border_width_changed)
+        self.btn_border_color = self._make_color_button(48, 28)
+        for text, widget in (("Fill", self.btn_bg_color), ("Width", self.spin_border_width), ("Stroke", self.btn_border_color)):
+            solid_controls_layout.addLayout(self._labeled_column(text, widget), 1)
         main_layout.addWidget(self.solid_controls_widget)
 
         shape_details_layout = QHBoxLayout()
@@ -156,110 +160,154 @@ class ShapeStylePanel(QWidget):
         shape_details_layout.addLayout(radius_layout, 1)
         main_layout.addLayout(shape_details_layout)
 
+        # The gradient controls are only built once "Linear Gradient" is first selected;
+        # until then their values live in _gradient_values
+        self.gradient_fill_group = None
+        self._gradient_values = {'color1': '#ff000000', 'color2': '#ff000000', 'direction': 0, 'midpoint': 50}
+        self._main_layout = main_layout
+        main_layout.addStretch()
+        self._toggle_fill_gradient_controls()
+
+        # Kept on the panel rather than the QApplication: the sheet has bare QLabel/QComboBox/QSpinBox
+        # rules that would restyle the whole app, and it must override the parent panel's sheet
+        self.setStyleSheet(SHAPE_PANEL_STYLE)
+
+    def _make_color_button(self, width, height):
+        """Creates a color swatch button wired to the shared color chooser slot."""
+        button = QPushButton("")
+        button.setObjectName("colorButton")
+        button.setFixedSize(width, height)
+        button.clicked.connect(self._on_color_button_clicked)
+        return button
+
+    @staticmethod
+    def _labeled_column(text, widget):
+        """Returns a QVBoxLayout with a tiny caption above the widget."""
+        layout = QVBoxLayout()
+        layout.setSpacing(2)
+        label = QLabel(text)
+        label.setObjectName("tinyLabel")
+        layout.addWidget(label)
+        layout.addWidget(widget)
+        return layout
+
+    @staticmethod
+    def _labeled_row(text, widget):
+        """Returns a QHBoxLayout with a caption left of the widget (1:2 stretch)."""
+        layout = QHBoxLayout()
+        layout.addWidget(QLabel(text), 1)
+        layout.addWidget(widget, 2)
+        return layout
+
+    def _build_gradient_ui(self):
+        """Creates the gradient fill controls and loads the values stored while they didn't exist."""
         self.gradient_fill_group = QFrame()
         self.gradient_fill_group.setObjectName("gradientGroup")
         gradient_fill_layout = QVBoxLayout(self.gradient_fill_group)
         gradient_fill_layout.setContentsMargins(0, 10, 0, 0)
         gradient_fill_layout.setSpacing(8)
 
-        bg_grad_col1_layout = QHBoxLayout()
-        bg_grad_col1_label = QLabel("  Start:")
-        bg_grad_col1_layout.addWidget(bg_grad_col1_label, 1)
-        self.btn_bg_gradient_color1 = QPushButton("")
-        self.btn_bg_gradient_color1.setObjectName("colorButton")
-        self.btn_bg_gradient_color1.setFixedSize(32, 24)
-        self.btn_bg_gradient_color1.clicked.connect(lambda: self._handle_color_choice(self.btn_bg_gradient_color1))
-        bg_grad_col1_layout.addWidget(self.btn_bg_gradient_color1, 2)
-        gradient_fill_layout.addLayout(bg_grad_col1_layout)
-
-        bg_grad_col2_layout = QHBoxLayout()
-        bg_grad_col2_label = QLabel("  End:")
-        bg_grad_col2_layout.addWidget(bg_grad_col2_label, 1)
-        self.btn_bg_gradient_color2 = QPushButton("")
-        self.btn_bg_gradient_color2.setObjectName("colorButton")
-        self.btn_bg_gradient_color2.setFixedSize(32, 24)
-        self.btn_bg_gradient_color2.clicked.connect(lambda: self._handle_color_choice(self.btn_bg_gradient_color2))
-        bg_grad_col2_layout.addWidget(self.btn_bg_gradient_color2, 2)
-        gradient_fill_layout.addLayout(bg_grad_col2_layout)
-
-        bg_grad_mid_layout = QHBoxLayout()
-        bg_grad_mid_label = QLabel("  Midpoint (%):")
-        bg_grad_mid_layout.addWidget(bg_grad_mid_label, 1)
+        self.btn_bg_gradient_color1 = self._make_color_button(32, 24)
+        self.btn_bg_gradient_color2 = self._make_color_button(32, 24)
+
         self.spin_bg_gradient_midpoint = QSpinBox()
         self.spin_bg_gradient_midpoint.setObjectName("gradientMidpointSpinBox")
         self.spin_bg_gradient_midpoint.setRange(0, 100)
         self.spin_bg_gradient_midpoint.setValue(50)
         self.spin_bg_gradient_midpoint.setSuffix("%")
         self.spin_bg_gradient_midpoint.valueChanged.connect(self._on_style_changed)
-        bg_grad_mid_layout.addWidget(self.spin_bg_gradient_midpoint, 2)
-        gradient_fill_layout.addLayout(bg_grad_mid_layout)
 
-        bg_grad_dir_layout = QHBoxLayout()
-        bg_grad_dir_label = QLabel("  Direction:")
-        bg_grad_dir_layout.addWidget(bg_grad_dir_label, 1)
         self.combo_bg_gradient_direction = QComboBox()
         self.combo_bg_gradient_direction.setObjectName("styleCombo")
         self.combo_bg_gradient_direction.addItems(["Horizontal (L>R)", "Vertical (T>B)", "Diagonal (TL>BR)", "Diagonal (BL>TR)"])
         self.combo_bg_gradient_direction.currentIndexChanged.connect(self._on_style_changed)
-        bg_grad_dir_layout.addWidget(self.combo_bg_gradient_direction, 2)
-        gradient_fill_layout.addLayout(bg_grad_dir_layout)
-        
-        main_layout.addWidget(self.gradient_fill_group)
-        main_layout.addStretch()
-        self._toggle_fill_gradient_controls()
-        
-        self.setStyleSheet(SHAPE_PANEL_STYLE)
+
+        for text, widget in (("  Start:", self.btn_bg_gradient_color1), ("  End:", self.btn_bg_gradient_color2),
+                             ("  Midpoint (%):", self.spin_bg_gradient_midpoint), ("  Direction:", self.combo_bg_gradient_direction)):
+            gradient_fill_layout.addLayout(self._labeled_row(text, widget))
+
+        self._main_layout.insertWidget(self._main_layout.count() - 1, self.gradient_fill_group) # Before the stretch
+        values, self._gradient_values = self._gradient_values, None
+        self._set_gradient_values(values)
+
+    def _get_gradient_values(self):
+        """Returns the 'bg_gradient' part of the style, from the controls if they have been built."""
+        if self.gradient_fill_group is None:
+            return dict(self._gradient_values)
+        return {
+            'color1': self._get_color_hex(self.btn_bg_gradient_color1),
+            'color2': self._get_color_hex(self.btn_bg_gradient_color2),
+            'direction': self.combo_bg_gradient_direction.currentIndex(),
+            'midpoint': self.spin_bg_gradient_midpoint.value(),
+        }
+
+    def _set_gradient_values(self, bg_gradient):
+        """Loads a 'bg_gradient' dict into the controls, or stores it until they are built."""
+        if self.gradient_fill_group is None:
+            color1, color2 = QColor(bg_gradient.get('color1')), QColor(bg_gradient.get('color2'))
+            # Invalid colors fall back to white, as in set_button_color
+            self._gradient_values = {
+                'color1': color1.name(QColor.HexArgb) if color1.isValid() else '#ffffffff',
+                'color2': color2.name(QColor.HexArgb) if color2.isValid() else '#ffffffff',
+                'direction': bg_gradient.get('direction', 0),
+                'midpoint': int(bg_gradient.get('midpoint', 50)),
+            }
+            return
+        with QSignalBlocker(self.combo_bg_gradient_direction), QSignalBlocker(self.spin_bg_gradient_midpoint):
+            self.set_button_color(self.btn_bg_gradient_color1, bg_gradient.get('color1'))
+            self.set_button_color(self.btn_bg_gradient_color2, bg_gradient.get('color2'))
+            self.combo_bg_gradient_direction.setCurrentIndex(bg_gradient.get('direction', 0))
+            self.spin_bg_gradient_midpoint.setValue(int(bg_gradient.get('midpoint', 50)))
+
+    @Slot()
+    def _on_color_button_clicked(self):
+        """Shared clicked slot for the color buttons; avoids a lambda per button."""
+        self._handle_color_choice(self.sender())
 
     def _handle_color_choice(self, button):
         """
-        Generic handler for all color buttons. It uses the external chooser
-        and ensures the internal state ("colorValue" property) is updated correctly.
+        Generic handler for all color buttons. It asks the external chooser for a
+        color and stores it on the button ("colorValue" property).
         """
         current_color = self._get_color_from_button(button)
+        new_color = self._color_chooser_fn(current_color)
+        if new_color is None or new_color == current_color:
+            return
 
-        # Temporarily set a simple background for the generic color picker to read.
-        button.setStyleSheet(f"background-color: {current_color.name(QColor.HexArgb)};")
-
-        # Call the modal color chooser function passed from the parent.
-        # This function will modify the button's stylesheet directly.
-        self._color_chooser_fn(button)
-
-        # After the chooser closes, parse the new color it has set on the stylesheet.
-        style = button.styleSheet()
-        new_color_str = current_color.name(QColor.HexArgb) # Default to old color on failure
-        try:
-            start = style.find("background-color:") + len("background-color:")
-            end = style.find(";", start)
-            if end == -1: end = len(style)
-            parsed_color = style[start:end].strip()
-            if QColor(parsed_color).isValid():
-                new_color_str = parsed_color
-        except:
-            pass # On error, new_color_str remains the old color
-
-        # Set the new color in our model. This also restores the correct visual preview
-        self.set_button_color(button, new_color_str)
-        
-        # If the color actually changed, emit the signal to the parent.
-        if QColor(new_color_str) != current_color:
-            self._on_style_changed()
+        # Set the new color in our model. This also updates the visual preview
+        self.set_button_color(button, new_color.name(QColor.HexArgb))
+        self._on_style_changed()
+
+    @Slot(int)
+    def _on_fill_type_changed(self, _index):
+        self._toggle_fill_gradient_controls()
+        self._on_style_changed()
+
+    @Slot(int)
+    def _on_border_width_changed(self, _value):
+        self._update_stroke_button_visuals()
+        self._on_style_changed()
 
     def _on_style_changed(self):
-        """Emits the style_changed signal if controls are not being updated programmatically."""
+        """Schedules a style_changed emission if controls are not being updated programmatically."""
         if not self._updating_controls:
-            self.style_changed.emit()
+            self._emit_timer.start()
 
     def _get_color_from_button(self, button):
         """Extracts the QColor from a button's custom property."""
-        color_str = button.property("colorValue")
-        if color_str and QColor(color_str).isValid():
-            return QColor(color_str)
-        return QColor("#000000")
+        color = button.property("colorValue")
+        return color if isinstance(color, QColor) and color.isValid() else QColor("#000000")
 
     def _toggle_fill_gradient_controls(self):
         """Shows or hides the gradient controls based on the fill type selection."""
         is_gradient = self.combo_fill_type.currentIndex() == 1
-        self.gradient_fill_group.setVisible(is_gradient)
+        if is_gradient == self._last_gradient_state:
+            return # Already showing the right controls; skip the relayout
+        self._last_gradient_state = is_gradient
+        if is_gradient and self.gradient_fill_group is None:
+            self._build_gradient_ui()
+        if self.gradient_fill_group is not None:
+            self.gradient_fill_group.setVisible(is_gradient)
         self.solid_controls_widget.setVisible(not is_gradient)
 
     def _update_stroke_button_visuals(self):
@@ -267,24 +315,18 @@ class ShapeStylePanel(QWidget):
         Updates the visual style of the stroke button to preview the
         color and width. The width in the preview is capped for clarity.
         """
-        if not hasattr(self, 'btn_border_color'): return
-
         width = self.spin_border_width.value()
         preview_width = min(width, 4) # Cap visual width at 4px
         color = self._get_color_from_button(self.btn_border_color)
-        
-        hover_color = color.lighter(130)
-
-        self.btn_border_color.setStyleSheet(f"""
-            QPushButton#colorButton {{
-                background-color: transparent;
-                border: {preview_width}px solid {color.name(QColor.HexArgb)};
-                border-radius: 3px;
-            }}
-            QPushButton#colorButton:hover {{
-                border-color: {hover_color.name(QColor.HexArgb)};
-            }}
-        """)
+
+        key = (preview_width, color.rgba())
+        style = self._stroke_style_cache.get(key)
+        if style is None:
+            if len(self._stroke_style_cache) > 64: self._stroke_style_cache.clear()
+            style = self._stroke_style_cache[key] = _STROKE_BUTTON_STYLE % (
+                preview_width, color.name(QColor.HexArgb), color.lighter(130).name(QColor.HexArgb))
+        if self.btn_border_color.styleSheet() != style:
+            self.btn_border_color.setStyleSheet(style)
 
     def set_button_color(self, button, color_str):
         """Sets the color for a button, storing it in a property and updating visuals."""
@@ -292,13 +334,25 @@ class ShapeStylePanel(QWidget):
         if not color.isValid():
             color = QColor("#ffffff") # Default to white if invalid
         
-        button.setProperty("colorValue", color.name(QColor.HexArgb))
-
         if button is self.btn_border_color:
+            # The stroke preview also depends on the width; it skips an unchanged stylesheet itself
+            button.setProperty("colorValue", color) # Kept as a QColor so reads don't reparse a string
+            button.setProperty("colorHex", color.name(QColor.HexArgb)) # Formatted once for get_style
             self._update_stroke_button_visuals()
         else:
+            prior = button.property("colorValue")
+            if isinstance(prior, QColor) and prior == color:
+                return # Same color already stored and shown
+            hex_str = color.name(QColor.HexArgb)
+            button.setProperty("colorValue", color)
+            button.setProperty("colorHex", hex_str)
             # For all other buttons, just set the background color
-            button.setStyleSheet(f"background-color: {color.name(QColor.HexArgb)};")
+            button.setStyleSheet(f"background-color: {hex_str};")
+
+    @staticmethod
+    def _get_color_hex(button):
+        """Returns the button's color as the #AARRGGBB string stored by set_button_color."""
+        return button.property("colorHex") or "#ff000000"
 
     def get_style(self):
         """Retrieves the current style settings from the UI controls."""
@@ -306,41 +360,36 @@ class ShapeStylePanel(QWidget):
             'bubble_type': self.combo_bubble_type.currentIndex(),
             'corner_radius': self.spin_corner_radius.value(),
             'border_width': self.spin_border_width.value(),
-            'border_color': self._get_color_from_button(self.btn_border_color).name(QColor.HexArgb),
+            'border_color': self._get_color_hex(self.btn_border_color),
             'fill_type': 'linear_gradient' if self.combo_fill_type.currentIndex() == 1 else 'solid',
-            'bg_color': self._get_color_from_button(self.btn_bg_color).name(QColor.HexArgb),
-            'bg_gradient': {
-                'color1': self._get_color_from_button(self.btn_bg_gradient_color1).name(QColor.HexArgb),
-                'color2': self._get_color_from_button(self.btn_bg_gradient_color2).name(QColor.HexArgb),
-                'direction': self.combo_bg_gradient_direction.currentIndex(),
-                'midpoint': self.spin_bg_gradient_midpoint.value(),
-            },
+            'bg_color': self._get_color_hex(self.btn_bg_color),
+            'bg_gradient': self._get_gradient_values(),
         }
         return style
 
     def set_style(self, style_dict, default_gradient):
         """Updates the UI controls with the values from a given style dictionary."""
         self._updating_controls = True
-        
-        self.combo_bubble_type.setCurrentIndex(style_dict.get('bubble_type', 1))
-        self.spin_corner_radius.setValue(style_dict.get('corner_radius', 10))
-        self.spin_border_width.setValue(style_dict.get('border_width', 1))
-        
-        # This will set the property and call _update_stroke_button_visuals
-        self.set_button_color(self.btn_border_color, style_dict.get('border_color', '#ff000000'))
+        self._emit_timer.stop() # A pending change belongs to the style being replaced
 
-        fill_type = style_dict.get('fill_type', 'solid')
-        self.combo_fill_type.setCurrentIndex(1 if fill_type == 'linear_gradient' else 0)
-        self.set_button_color(self.btn_bg_color, style_dict.get('bg_color', '#ffffffff'))
+        # Blocked so the value/index signals don't dispatch into slots that would only be ignored;
+        # the dependent visuals are refreshed once below instead
+        with QSignalBlocker(self.combo_bubble_type), QSignalBlocker(self.spin_corner_radius), \
+                QSignalBlocker(self.spin_border_width), QSignalBlocker(self.combo_fill_type):
+            self.combo_bubble_type.setCurrentIndex(style_dict.get('bubble_type', 1))
+            self.spin_corner_radius.setValue(style_dict.get('corner_radius', 10))
+            self.spin_border_width.setValue(style_dict.get('border_width', 1))
 
-        bg_gradient = style_dict.get('bg_gradient', default_gradient)
-        if bg_gradient:
-            self.set_button_color(self.btn_bg_gradient_color1, bg_gradient.get('color1'))
-            self.set_button_color(self.btn_bg_gradient_color2, bg_gradient.get('color2'))
-            self.combo_bg_gradient_direction.setCurrentIndex(bg_gradient.get('direction', 0))
-            self.spin_bg_gradient_midpoint.setValue(int(bg_gradient.get('midpoint', 50)))
+            # This will set the property and call _update_stroke_button_visuals with the new width
+            self.set_button_color(self.btn_border_color, style_dict.get('border_color', '#ff000000'))
+
+            fill_type = style_dict.get('fill_type', 'solid')
+            self.combo_fill_type.setCurrentIndex(1 if fill_type == 'linear_gradient' else 0)
+            self.set_button_color(self.btn_bg_color, style_dict.get('bg_color', '#ffffffff'))
+
+            bg_gradient = style_dict.get('bg_gradient', default_gradient)
+            if bg_gradient:
+                self._set_gradient_values(bg_gradient)
 
         self._toggle_fill_gradient_controls()
         self._updating_controls = False
-        # Final visual update just in case
-        self._update_stroke_button_visuals()
\ No newline at end of file
@@ -1,11 +1,100 @@
 import os
+import re
+import json
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QComboBox, QSpinBox, 
                              QHBoxLayout, QPushButton, QFrame, QButtonGroup, QCheckBox)
-from PySide6.QtCore import Signal, Qt, QSize
+from PySide6.QtCore import Signal, Slot, Qt, QSize, QStandardPaths, QThread, QSignalBlocker, QTimer
 from PySide6.QtGui import QFontDatabase, QColor, QIcon
 import qtawesome as qta
 from assets import TYPOGRAPHY_PANEL_STYLE
 
+_FONTS_DIR = "assets/fonts"
+_EXCLUDED_STYLE_RE = re.compile("bold|italic|oblique", re.IGNORECASE) # One C-level scan per style name
+_font_scan = None # _FontScanThread shared by every panel; started once per process
+
+def _register_custom_fonts(fonts_dir):
+    """Registers the bundled fonts with Qt and returns {file: [mtime_ns, size, families]} for the loaded ones."""
+    db = QFontDatabase()
+    files = {}
+    for file in os.listdir(fonts_dir):
+        if file.lower().endswith(('.ttf', '.otf')):
+            font_path = os.path.join(fonts_dir, file)
+            font_id = db.addApplicationFont(font_path)
+            if font_id != -1:
+                stat = os.stat(font_path)
+                files[file] = [stat.st_mtime_ns, stat.st_size, db.applicationFontFamilies(font_id)]
+            else:
+                print(f"Warning: Could not load font: {font_path}")
+    return files
+
+class _FontScanThread(QThread):
+    """Works out the selectable (non bold/italic) styles of each registered family off the GUI thread."""
+    def __init__(self, files):
+        super().__init__()
+        self.files = files
+        self.font_styles = {} # { "Family Name": ["Style1", "Style2", ...] }, filled by run()
+
+    def run(self):
+        files = self.files
+        # The style list per family is cached on disk, keyed by each font file's mtime and size; only families
+        # touched by a new, changed or removed file are queried from QFontDatabase again
+        cache_path = os.path.join(QStandardPaths.writableLocation(QStandardPaths.CacheLocation), "font_styles.json")
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            cached_files, cached_styles = cache["files"], cache["font_styles"]
+        except (OSError, ValueError, KeyError, TypeError):
+            cached_files, cached_styles = {}, {}
+
+        db = QFontDatabase()
+        loaded_families = set()
+        stale_families = set()
+        for file, entry in files.items():
+            loaded_families.update(entry[2])
+            if cached_files.get(file) != entry:
+                stale_families.update(entry[2])
+        for file, entry in cached_files.items():
+            if file not in files and isinstance(entry, list) and len(entry) == 3:
+                stale_families.update(entry[2]) # A removed file may have contributed styles to a family
+
+        font_styles = {}
+        for family in sorted(list(loaded_families)):
+            if family not in stale_families and cached_styles.get(family):
+                font_styles[family] = cached_styles[family]
+                continue
+
+            styles = db.styles(family)
+            # Bold/italic are separate toggles, so those styles are not offered. "Regular" always passes the
+            # filter, so an empty result means the family only has bold/italic styles
+            filtered_styles = [s for s in styles if not _EXCLUDED_STYLE_RE.search(s)]
+            if not filtered_styles:
+                filtered_styles.append(styles[0] if styles else "Regular")
+            font_styles[family] = sorted(filtered_styles)
+        self.font_styles = font_styles
+
+        if files != cached_files or font_styles != cached_styles:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(cache_path, "w", encoding="utf-8") as f:
+                    json.dump({"files": files, "font_styles": font_styles}, f)
+            except OSError as e:
+                print(f"Warning: Could not write font style cache: {e}")
+
+def start_custom_font_scan():
+    """
+    Registers the bundled fonts (on the calling GUI thread, so text boxes can render them right away) and
+    starts the style scan in the background. Safe to call repeatedly; returns the shared scan thread,
+    or None if the font directory is missing.
+    """
+    global _font_scan
+    if _font_scan is None:
+        if not os.path.exists(_FONTS_DIR):
+            print(f"Font directory not found: {_FONTS_DIR}")
+            return None
+        _font_scan = _FontScanThread(_register_custom_fonts(_FONTS_DIR))
+        _font_scan.start()
+    return _font_scan
+
 class TypographyStylePanel(QWidget):
     """
     A widget panel for managing the typography styles of a text box, including
@@ -13,12 +102,14 @@ class TypographyStylePanel(QWidget):
     """
     style_changed = Signal()
 
+    _TOOLBAR_ICONS = None # Built on first use; needs a running QApplication
+
     def __init__(self, color_chooser_fn, parent=None):
         """
         Initializes the typography style panel.
         
         Args:
-            color_chooser_fn (function): A function to be called to open a color dialog.
+            color_chooser_fn (function): Opens a color dialog at a QColor and returns the chosen QColor, or None.
             parent (QWidget, optional): The parent widget. Defaults to None.
         """
         super().__init__(parent)
@@ -26,10 +117,28 @@ class TypographyStylePanel(QWidget):
         self._color_chooser_fn = color_chooser_fn
         self._updating_controls = False
         self.font_styles = {} # { "Family Name": ["Style1", "Style2", ...] }
+        self._fonts_loaded = False
+        self._pending_font = None # (family, style) requested by set_style while the font scan was still running
+        self._font_style_combo_family = None # Family whose styles combo_font_style currently lists
+        # Coalesces bursts of control changes (e.g. a held spinbox arrow) into one style_changed per event loop pass
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self.style_changed.emit)
         self.init_ui()
         self.load_custom_fonts()
         self._update_font_style_combo()
 
+    @classmethod
+    def _get_toolbar_icons(cls):
+        """Returns the alignment/bold/italic icons, rasterized from qtawesome once and shared by every panel."""
+        if cls._TOOLBAR_ICONS is None:
+            icon_size = QSize(16, 16)
+            icon_color = "#EAEAEA"
+            cls._TOOLBAR_ICONS = {name: QIcon(qta.icon(f'fa5s.{name}', color=icon_color).pixmap(icon_size))
+                                  for name in ('align-left', 'align-center', 'align-right', 'bold', 'italic')}
+        return cls._TOOLBAR_ICONS
+
     def init_ui(self):
         """Initializes the user interface for the typography panel."""
         main_layout = QVBoxLayout(self)
@@ -46,8 +155,7 @@ class TypographyStylePanel(QWidget):
         self.combo_text_color_type = QComboBox()
         self.combo_text_color_type.setObjectName("styleCombo")
         self.combo_text_color_type.addItems(["Solid", "Linear Gradient"])
-        self.combo_text_color_type.currentIndexChanged.connect(self._toggle_text_gradient_controls)
-        self.combo_text_color_type.currentIndexChanged.connect(self._on_style_changed)
+        self.combo_text_color_type.currentIndexChanged.connect(self._on_color_type_changed)
         main_layout.addWidget(self.combo_text_color_type)
 
         # --- Solid Color Controls ---
@@ -64,7 +172,7 @@ class TypographyStylePanel(QWidget):
         self.btn_text_color = QPushButton("")
         self.btn_text_color.setObjectName("colorButton")
         self.btn_text_color.setFixedSize(48, 28)
-        self.btn_text_color.clicked.connect(lambda: self._color_chooser_fn(self.btn_text_color))
+        self.btn_text_color.clicked.connect(self._on_color_button_clicked)
         color_layout.addWidget(self.btn_text_color)
         solid_controls_layout.addLayout(color_layout)
         solid_controls_layout.addStretch()
@@ -83,7 +191,7 @@ class TypographyStylePanel(QWidget):
         self.btn_text_gradient_color1 = QPushButton("")
         self.btn_text_gradient_color1.setObjectName("colorButton")
         self.btn_text_gradient_color1.setFixedSize(32, 24)
-        self.btn_text_gradient_color1.clicked.connect(lambda: self._color_chooser_fn(self.btn_text_gradient_color1))
+        self.btn_text_gradient_color1.clicked.connect(self._on_color_button_clicked)
         text_grad_col1_layout.addWidget(self.btn_text_gradient_color1, 2)
         gradient_text_layout.addLayout(text_grad_col1_layout)
 
@@ -93,7 +201,7 @@ class TypographyStylePanel(QWidget):
         self.btn_text_gradient_color2 = QPushButton("")
         self.btn_text_gradient_color2.setObjectName("colorButton")
         self.btn_text_gradient_color2.setFixedSize(32, 24)
-        self.btn_text_gradient_color2.clicked.connect(lambda: self._color_chooser_fn(self.btn_text_gradient_color2))
+        self.btn_text_gradient_color2.clicked.connect(self._on_color_button_clicked)
         text_grad_col2_layout.addWidget(self.btn_text_gradient_color2, 2)
         gradient_text_layout.addLayout(text_grad_col2_layout)
 
@@ -123,21 +231,18 @@ class TypographyStylePanel(QWidget):
         # --- Font Family Dropdown ---
         self.combo_font_family = QComboBox()
         self.combo_font_family.setObjectName("styleCombo")
-        self.combo_font_family.currentIndexChanged.connect(self._update_font_style_combo)
-        self.combo_font_family.currentIndexChanged.connect(self._on_style_changed)
+        # Scrolling list popup with fixed-height rows, so opening it doesn't lay out every family
+        self.combo_font_family.setMaxVisibleItems(20)
+        self.combo_font_family.view().setUniformItemSizes(True)
+        self.combo_font_family.setStyleSheet("QComboBox { combobox-popup: 0; }")
+        self.combo_font_family.currentIndexChanged.connect(self._update_font_style_combo) # Reports the change itself
         main_layout.addWidget(self.combo_font_family)
 
         # --- Alignment and Style Toggles ---
         props_layout1 = QHBoxLayout()
         props_layout1.setSpacing(5)
         
-        icon_size = QSize(16, 16)
-        icon_color = "#EAEAEA"
-        align_left_pixmap = qta.icon('fa5s.align-left', color=icon_color).pixmap(icon_size)
-        align_center_pixmap = qta.icon('fa5s.align-center', color=icon_color).pixmap(icon_size)
-        align_right_pixmap = qta.icon('fa5s.align-right', color=icon_color).pixmap(icon_size)
-        bold_pixmap = qta.icon('fa5s.bold', color=icon_color).pixmap(icon_size)
-        italic_pixmap = qta.icon('fa5s.italic', color=icon_color).pixmap(icon_size)
+        icons = type(self)._get_toolbar_icons()
 
         alignment_buttons_layout = QHBoxLayout()
         alignment_buttons_layout.setSpacing(0)
@@ -148,7 +253,7 @@ class TypographyStylePanel(QWidget):
         self.btn_align_left.setCheckable(True)
         self.btn_align_left.setObjectName("alignButton")
         self.btn_align_left.setToolTip("Align Left")
-        self.btn_align_left.setIcon(QIcon(align_left_pixmap))
+        self.btn_align_left.setIcon(icons['align-left'])
         self.alignment_group.addButton(self.btn_align_left, 0)
         alignment_buttons_layout.addWidget(self.btn_align_left)
         
@@ -157,7 +262,7 @@ class TypographyStylePanel(QWidget):
         self.btn_align_center.setObjectName("alignButton")
         self.btn_align_center.setToolTip("Align Center")
         self.btn_align_center.setChecked(True)
-        self.btn_align_center.setIcon(QIcon(align_center_pixmap))
+        self.btn_align_center.setIcon(icons['align-center'])
         self.alignment_group.addButton(self.btn_align_center, 1)
         alignment_buttons_layout.addWidget(self.btn_align_center)
 
@@ -165,7 +270,7 @@ class TypographyStylePanel(QWidget):
         self.btn_align_right.setCheckable(True)
         self.btn_align_right.setObjectName("alignButton")
         self.btn_align_right.setToolTip("Align Right")
-        self.btn_align_right.setIcon(QIcon(align_right_pixmap))
+        self.btn_align_right.setIcon(icons['align-right'])
         self.alignment_group.addButton(self.btn_align_right, 2)
         alignment_buttons_layout.addWidget(self.btn_align_right)
         
@@ -177,7 +282,7 @@ class TypographyStylePanel(QWidget):
         self.btn_font_bold.setCheckable(True)
         self.btn_font_bold.setObjectName("styleToggleButton")
         self.btn_font_bold.setToolTip("Bold")
-        self.btn_font_bold.setIcon(QIcon(bold_pixmap))
+        self.btn_font_bold.setIcon(icons['bold'])
         self.btn_font_bold.toggled.connect(self._on_style_changed)
         props_layout1.addWidget(self.btn_font_bold)
 
@@ -185,7 +290,7 @@ class TypographyStylePanel(QWidget):
         self.btn_font_italic.setCheckable(True)
         self.btn_font_italic.setObjectName("styleToggleButton")
         self.btn_font_italic.setToolTip("Italic")
-        self.btn_font_italic.setIcon(QIcon(italic_pixmap))
+        self.btn_font_italic.setIcon(icons['italic'])
         self.btn_font_italic.toggled.connect(self._on_style_changed)
         props_layout1.addWidget(self.btn_font_italic)
         props_layout1.addStretch()
@@ -242,27 +347,38 @@ class TypographyStylePanel(QWidget):
         
         self.setStyleSheet(TYPOGRAPHY_PANEL_STYLE)
 
+    @Slot()
+    def _on_color_button_clicked(self):
+        """Shared clicked slot for the color buttons; avoids a lambda per button."""
+        self._handle_color_choice(self.sender())
+
+    def _handle_color_choice(self, button):
+        """Asks the external chooser for a color starting from the button's current one and stores the result on the button."""
+        current_color = self._get_color_from_button(button)
+        new_color = self._color_chooser_fn(current_color)
+        if new_color is None or new_color == current_color:
+            return
+        self.set_button_color(button, new_color.name(QColor.HexArgb))
+        self._on_style_changed()
+
+    @Slot(int)
+    def _on_color_type_changed(self, _index):
+        self._toggle_text_gradient_controls()
+        self._on_style_changed()
+
     def _on_style_changed(self):
         if not self._updating_controls:
-            self.style_changed.emit()
+            self._emit_timer.start()
 
     def _get_color_from_button(self, button):
-        style = button.styleSheet()
-        try:
-            start = style.find("background-color:") + len("background-color:")
-            end = style.find(";", start)
-            if end == -1: end = len(style)
-            color_str = style[start:end].strip()
-            if QColor(color_str).isValid():
-                return QColor(color_str)
-        except:
-            pass
-        return QColor("#000000")
+        color = button.property("colorValue") # QColor stored by set_button_color
+        return color if isinstance(color, QColor) and color.isValid() else QColor("#000000")
     
     def set_button_color(self, button, color_str):
         color = QColor(color_str)
         if not color.isValid():
             color = QColor(255, 255, 255)
+        button.setProperty("colorValue", color) # Kept as a QColor so reads don't reparse a string
         button.setStyleSheet(f"background-color: {color.name(QColor.HexArgb)}; border: 1px solid #60666E; border-radius: 3px;")
 
     def _toggle_text_gradient_controls(self):
@@ -280,63 +396,64 @@ class TypographyStylePanel(QWidget):
         self._on_style_changed()
 
     def load_custom_fonts(self):
+        """Fills the family combo from the background font scan, now if it is done or once it finishes."""
         self.font_styles.clear()
+        self._font_style_combo_family = None
         self.combo_font_family.clear()
         self.combo_font_family.addItem("Default (System Font)")
-        
-        fonts_dir = "assets/fonts"
-        if not os.path.exists(fonts_dir):
-            print(f"Font directory not found: {fonts_dir}")
-            return
-
-        db = QFontDatabase()
-        loaded_families = set()
-
-        for file in os.listdir(fonts_dir):
-            if file.lower().endswith(('.ttf', '.otf')):
-                font_path = os.path.join(fonts_dir, file)
-                font_id = db.addApplicationFont(font_path)
-                if font_id != -1:
-                    families = db.applicationFontFamilies(font_id)
-                    for family in families:
-                        loaded_families.add(family)
-                else:
-                    print(f"Warning: Could not load font: {font_path}")
-
-        for family in sorted(list(loaded_families)):
-            styles = db.styles(family)
-            filtered_styles = [s for s in styles if "bold" not in s.lower() and "italic" not in s.lower() and "oblique" not in s.lower()]
-            if not filtered_styles and "Regular" in styles:
-                filtered_styles.append("Regular")
-            elif not filtered_styles: # Case where only bold/italic styles exist
-                filtered_styles.append(styles[0] if styles else "Regular")
+        self._fonts_loaded = False
 
-
-            if filtered_styles:
-                self.font_styles[family] = sorted(filtered_styles)
-                self.combo_font_family.addItem(family)
+        scan = start_custom_font_scan()
+        if scan is None:
+            self._fonts_loaded = True
+            return
+        scan.finished.connect(self._apply_font_scan) # Queued to this (GUI) thread
+        if scan.isFinished():
+            self._apply_font_scan()
+
+    @Slot()
+    def _apply_font_scan(self):
+        if self._fonts_loaded: return
+        self._fonts_loaded = True
+        self.font_styles.update(_font_scan.font_styles)
+        self._font_style_combo_family = None # Style lists are now known; refill on the next family change
+        with QSignalBlocker(self.combo_font_family): # One bulk insert instead of a signal per family
+            self.combo_font_family.addItems(list(self.font_styles))
+
+        if self._pending_font is not None:
+            # set_style ran before the families were known; select what it asked for now
+            font_family, font_style = self._pending_font
+            self._pending_font = None
+            self._updating_controls = True
+            self._select_font(font_family, font_style)
+            self._updating_controls = False
 
     def _update_font_style_combo(self):
         if self._updating_controls: return
         
         current_family = self.combo_font_family.currentText()
-        self.combo_font_style.clear()
-
-        if current_family in self.font_styles and self.font_styles[current_family]:
-            styles = self.font_styles[current_family]
-            self.combo_font_style.addItems(styles)
-            if "Regular" in styles:
-                self.combo_font_style.setCurrentText("Regular")
-            self.font_style_widget.setVisible(True)
-        else:
-            self.font_style_widget.setVisible(False)
+        # set_style can move the family combo without refilling the styles, so a family change may land back on
+        # the family that is already listed; the change is still reported, only the clear/refill is skipped
+        if current_family != self._font_style_combo_family:
+            self._font_style_combo_family = current_family
+            with QSignalBlocker(self.combo_font_style):
+                self.combo_font_style.clear()
+                if current_family in self.font_styles and self.font_styles[current_family]:
+                    styles = self.font_styles[current_family]
+                    self.combo_font_style.addItems(styles)
+                    if "Regular" in styles:
+                        self.combo_font_style.setCurrentText("Regular")
+            self.font_style_widget.setVisible(current_family in self.font_styles and bool(self.font_styles[current_family]))
         self._on_style_changed()
 
 
     def get_style(self, default_font_family, default_font_style):
         selected_family_text = self.combo_font_family.currentText()
 
-        if selected_family_text == "Default (System Font)":
+        if self._pending_font is not None:
+            # Families are still loading; report the font set_style asked for rather than the placeholder default
+            font_family, font_style = self._pending_font
+        elif selected_family_text == "Default (System Font)":
             font_family = default_font_family
             font_style = default_font_style
         else:
@@ -366,23 +483,7 @@ class TypographyStylePanel(QWidget):
         }
         return style
 
-    def set_style(self, style_dict, default_gradient):
-        self._updating_controls = True
-        
-        text_color_type = style_dict.get('text_color_type', 'solid')
-        self.combo_text_color_type.setCurrentIndex(1 if text_color_type == 'linear_gradient' else 0)
-        self.set_button_color(self.btn_text_color, style_dict.get('text_color', '#ff000000'))
-        
-        text_gradient = style_dict.get('text_gradient', default_gradient)
-        if text_gradient:
-            self.set_button_color(self.btn_text_gradient_color1, text_gradient.get('color1'))
-            self.set_button_color(self.btn_text_gradient_color2, text_gradient.get('color2'))
-            self.combo_text_gradient_direction.setCurrentIndex(text_gradient.get('direction', 0))
-            self.spin_text_gradient_midpoint.setValue(int(text_gradient.get('midpoint', 50)))
-
-        font_family = style_dict.get('font_family', "Arial")
-        font_style = style_dict.get('font_style', 'Regular')
-
+    def _select_font(self, font_family, font_style):
         index = self.combo_font_family.findText(font_family)
         if index != -1:
             self.combo_font_family.setCurrentIndex(index)
@@ -401,18 +502,48 @@ class TypographyStylePanel(QWidget):
                 self.combo_font_style.setCurrentIndex(0)
                 print(f"Warning: Font style '{font_style}' not found, using first available.")
 
-        self.spin_font_size.setValue(style_dict.get('font_size', 12))
-        self.btn_font_bold.setChecked(style_dict.get('font_bold', False))
-        self.btn_font_italic.setChecked(style_dict.get('font_italic', False))
-        
-        alignment_index = style_dict.get('text_alignment', 1)
-        self.combo_text_alignment.setCurrentIndex(alignment_index)
-        # Programmatically check the correct button in the group
-        btn_to_check = self.alignment_group.button(alignment_index)
-        if btn_to_check:
-            btn_to_check.setChecked(True)
-
-        self.chk_auto_font_size.setChecked(style_dict.get('auto_font_size', True))
-        
+    def set_style(self, style_dict, default_gradient):
+        self._updating_controls = True
+        self._emit_timer.stop() # A pending change belongs to the style being replaced
+        # Blocked so loading a style doesn't dispatch a signal (and a no-op slot call) per control;
+        # the flag above still covers the slots this method calls directly
+        with QSignalBlocker(self.combo_text_color_type), QSignalBlocker(self.combo_text_gradient_direction), \
+                QSignalBlocker(self.spin_text_gradient_midpoint), QSignalBlocker(self.combo_font_family), \
+                QSignalBlocker(self.combo_font_style), QSignalBlocker(self.spin_font_size), QSignalBlocker(self.btn_font_bold), \
+                QSignalBlocker(self.btn_font_italic), QSignalBlocker(self.chk_auto_font_size), \
+                QSignalBlocker(self.alignment_group), QSignalBlocker(self.combo_text_alignment):
+            text_color_type = style_dict.get('text_color_type', 'solid')
+            self.combo_text_color_type.setCurrentIndex(1 if text_color_type == 'linear_gradient' else 0)
+            self.set_button_color(self.btn_text_color, style_dict.get('text_color', '#ff000000'))
+
+            text_gradient = style_dict.get('text_gradient', default_gradient)
+            if text_gradient:
+                self.set_button_color(self.btn_text_gradient_color1, text_gradient.get('color1'))
+                self.set_button_color(self.btn_text_gradient_color2, text_gradient.get('color2'))
+                self.combo_text_gradient_direction.setCurrentIndex(text_gradient.get('direction', 0))
+                self.spin_text_gradient_midpoint.setValue(int(text_gradient.get('midpoint', 50)))
+
+            font_family = style_dict.get('font_family', "Arial")
+            font_style = style_dict.get('font_style', 'Regular')
+
+            if self._fonts_loaded:
+                self._pending_font = None
+                self._select_font(font_family, font_style)
+            else:
+                self._pending_font = (font_family, font_style)
+
+            self.spin_font_size.setValue(style_dict.get('font_size', 12))
+            self.btn_font_bold.setChecked(style_dict.get('font_bold', False))
+            self.btn_font_italic.setChecked(style_dict.get('font_italic', False))
+
+            alignment_index = style_dict.get('text_alignment', 1)
+            self.combo_text_alignment.setCurrentIndex(alignment_index)
+            # Programmatically check the correct button in the group
+            btn_to_check = self.alignment_group.button(alignment_index)
+            if btn_to_check:
+                btn_to_check.setChecked(True)
+
+            self.chk_auto_font_size.setChecked(style_dict.get('auto_font_size', True))
+
         self._toggle_text_gradient_controls()
         self._updating_controls = False
\ No newline at end of file
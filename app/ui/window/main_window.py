@@ -53,6 +53,8 @@ class MainWindow(QMainWindow):
         self.update_shortcut()
 
         self.language_map = { "Korean": "ko", "Chinese": "ch_sim", "Japanese": "ja" }
+        # Image labels in scroll_layout order; rebuilt by refresh_image_labels() whenever labels are added/removed
+        self.image_labels: list[ResizableImageLabel] = []
 
         self.init_ui()
         self.combine_action.triggered.connect(self.results_widget.combine_selected_rows)
@@ -237,6 +239,7 @@ class MainWindow(QMainWindow):
             
             # Set flag to prevent textChanged events from deleting translations during profile switch
             # This is crucial because clearing highlighters triggers textChanged events
+            self.flush_pending_text_edits() # Debounced edits belong to the old profile
             if hasattr(self, 'results_widget') and self.results_widget:
                 self.results_widget._is_updating_views = True
             
@@ -307,6 +310,7 @@ class MainWindow(QMainWindow):
                  self.scroll_layout.addWidget(label)
             except Exception as e:
                  print(f"Error creating ResizableImageLabel for {image_path}: {e}")
+        self.refresh_image_labels()
         
         self._apply_inpaints()
 
@@ -314,17 +318,21 @@ class MainWindow(QMainWindow):
         self.on_model_updated(None)
         print(f"Project '{self.model.project_name}' loaded and UI populated.")
     
+    def refresh_image_labels(self):
+        """Rebuilds image_labels from scroll_layout. Call after adding or removing image labels."""
+        self.image_labels = [
+            widget
+            for i in range(self.scroll_layout.count())
+            if isinstance((widget := self.scroll_layout.itemAt(i).widget()), ResizableImageLabel)
+        ]
+
     def handle_inpaint_record_deleted(self, record_id):
         """Delegates the inpaint record deletion request to the model."""
         self.model.remove_inpaint_record(record_id)
     
     def _apply_inpaints(self):
         """Iterates through inpaint data and applies patches to the correct image labels."""
-        labels_by_filename = {
-            widget.filename: widget
-            for i in range(self.scroll_layout.count())
-            if isinstance((widget := self.scroll_layout.itemAt(i).widget()), ResizableImageLabel)
-        }
+        labels_by_filename = {label.filename: label for label in self.image_labels}
         
         inpaint_dir = os.path.join(self.model.temp_dir, 'inpaint')
 
@@ -346,9 +354,8 @@ class MainWindow(QMainWindow):
         """ SLOT: Handles the model_updated signal. Refreshes all relevant views. """
         if affected_filenames:
             for filename in affected_filenames:
-                for i in range(self.scroll_layout.count()):
-                    widget = self.scroll_layout.itemAt(i).widget()
-                    if isinstance(widget, ResizableImageLabel) and widget.filename == filename:
+                for widget in self.image_labels:
+                    if widget.filename == filename:
                         widget.revert_to_original()
                         self._apply_inpaints()
                         break
@@ -395,9 +402,8 @@ class MainWindow(QMainWindow):
         filename = target_result.get('filename')
         if not filename: return None
 
-        for i in range(self.scroll_layout.count()):
-            widget = self.scroll_layout.itemAt(i).widget()
-            if isinstance(widget, ResizableImageLabel) and widget.filename == filename:
+        for widget in self.image_labels:
+            if widget.filename == filename:
                 for tb in widget.get_text_boxes():
                     # Need to handle float vs int comparison carefully
                     try:
@@ -490,17 +496,15 @@ class MainWindow(QMainWindow):
                     grouped_results[filename] = {}
                 grouped_results[filename][result.get('row_number')] = result
 
-        for i in range(self.scroll_layout.count()):
-            widget = self.scroll_layout.itemAt(i).widget()
-            if isinstance(widget, ResizableImageLabel):
-                image_filename = widget.filename
-                if not affected_filenames or image_filename in affected_filenames:
-                    results_for_this_image = grouped_results.get(image_filename, {})
-                    records_for_this_image = [
-                        r for r in self.model.inpaint_data if r.get('target_image') == image_filename
-                    ]
-                    widget.update_inpaint_data(records_for_this_image)
-                    widget.apply_translation(self, results_for_this_image, DEFAULT_TEXT_STYLE)
+        for widget in self.image_labels:
+            image_filename = widget.filename
+            if not affected_filenames or image_filename in affected_filenames:
+                results_for_this_image = grouped_results.get(image_filename, {})
+                records_for_this_image = [
+                    r for r in self.model.inpaint_data if r.get('target_image') == image_filename
+                ]
+                widget.update_inpaint_data(records_for_this_image)
+                widget.apply_translation(self, results_for_this_image, DEFAULT_TEXT_STYLE)
 
     def start_ocr(self):
         if not self.model.image_paths:
@@ -602,9 +606,8 @@ class MainWindow(QMainWindow):
         SLOT: Handles the request from BatchOCRHandler to perform automatic inpainting.
         """
         target_label = None
-        for i in range(self.scroll_layout.count()):
-            widget = self.scroll_layout.itemAt(i).widget()
-            if isinstance(widget, ResizableImageLabel) and widget.filename == filename:
+        for widget in self.image_labels:
+            if widget.filename == filename:
                 target_label = widget
                 break
         
@@ -718,7 +721,13 @@ class MainWindow(QMainWindow):
         self.model.delete_row(row_number_to_delete)
         if self.find_replace_widget.isVisible(): self.find_replace_widget.find_text()
 
+    def flush_pending_text_edits(self):
+        """Commits simple-view typing still waiting on the debounce, so readers of the model see it."""
+        if hasattr(self, 'results_widget') and self.results_widget:
+            self.results_widget.flush_pending_text_edits()
+
     def start_translation(self):
+        self.flush_pending_text_edits()
         api_key = self.settings.value("gemini_api_key", "")
         if not api_key:
             QMessageBox.critical(self, "API Key Missing", "Please set your Gemini API key in Settings.")
@@ -752,6 +761,7 @@ class MainWindow(QMainWindow):
 
     def import_translation(self):
         """Import translation file - delegates to file_io handler."""
+        self.flush_pending_text_edits()
         import_translation_file(self)
 
     def update_shortcut(self):
@@ -760,12 +770,15 @@ class MainWindow(QMainWindow):
         self.update_find_shortcut()
 
     def export_manhwa(self):
+        self.flush_pending_text_edits()
         export_rendered_images(self)
 
     def export_ocr_results(self):
+        self.flush_pending_text_edits()
         export_ocr_results(self)
 
     def save_project(self):
+        self.flush_pending_text_edits()
         result_message = self.model.save_project()
         if "successfully" in result_message:
             # Success message - keep QMessageBox.information for non-error cases
@@ -774,6 +787,7 @@ class MainWindow(QMainWindow):
             ErrorDialog.critical(self, "Save Error", result_message)
 
     def closeEvent(self, event):
+        self.flush_pending_text_edits()
         if hasattr(self.model, 'temp_dir') and self.model.temp_dir and os.path.exists(self.model.temp_dir):
             try:
                 import shutil
@@ -243,7 +243,7 @@ def import_translation_file(self):
         if new_ocr_results is not None:
             try:
                 # Always replace existing OCR results
-                self.model.ocr_results = new_ocr_results
+                self.model.replace_results(new_ocr_results)
                 
                 # Reload profiles from the OCR results
                 loaded_profiles = set(["Original"])